@@ -0,0 +1,257 @@
+# Módulo compartilhado pelos scripts de análise (analyze_combined_report.py e
+# plot_final_report.py). Concentra a estrutura de matérias/submatérias, o
+# carregamento dos embeddings, o cálculo de similaridade e a contagem de
+# ocorrências — antes duplicados nos dois scripts, o que dobrava o custo de
+# carregar o modelo, codificar as keywords e calcular os scores.
+
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 1. Definição da estrutura de matérias e submatérias
+keywords_hierarchy = {
+    "biologia": {
+        "bioquímica": ["moléculas orgânicas", "enzimas", "metabolismo celular"],
+        "citologia": ["célula animal", "célula vegetal", "organelas", "membrana celular"],
+        "metabolismo energético": ["fotossíntese", "respiração celular", "fermentação"],
+        "ecologia": ["cadeias alimentares", "ciclos biogeoquímicos", "ecossistemas", "população", "biodiversidade", "impacto ambiental"]
+    },
+    "química": {
+        "química geral": ["matéria", "átomos", "moléculas", "propriedades físicas e químicas", "misturas homogêneas e heterogêneas", "métodos de separação"],
+        "leis ponderais": ["Lei de Lavoisier", "Lei de Proust"],
+        "tabela periódica": ["grupos", "períodos", "família", "metais", "ametais", "semimetais"],
+        "ligações químicas": ["iônica", "covalente", "metálica", "forças intermoleculares"],
+        "estequiometria": ["reação química", "mol", "massa molecular", "balanceamento"],
+        "química ambiental": ["poluição", "reações de combustão", "tratamento de resíduos"]
+    },
+    "física": {
+        "cinemática": ["movimento retilíneo", "movimento uniformemente variado", "gráfico de posição", "velocidade"],
+        "dinâmica": ["leis de Newton", "força", "massa", "aceleração", "atrito", "impulso"],
+        "hidrostática": ["pressão", "empuxo", "princípio de Pascal", "princípio de Arquimedes"],
+        "estática": ["equilíbrio de corpos", "torque", "centro de massa"],
+        "gravitação": ["lei da gravitação universal", "peso", "órbitas"]
+    },
+    "matemática": {
+        "matemática básica": ["operações", "frações", "porcentagem"],
+        "conjuntos": ["união", "interseção", "subconjuntos", "diagramas de Venn"],
+        "funções": ["função afim", "função quadrática", "função exponencial", "domínio", "imagem"],
+        "logaritmo": ["propriedades", "mudança de base"],
+        "progressões": ["PA e PG", "razões", "termos gerais"],
+        "geometria plana": ["ângulos", "triângulos", "polígonos", "circunferência", "área", "perímetro"]
+    },
+    "história": {
+        "idade antiga": ["Grecia antiga - democracia", "mitologia", "Roma antiga - república", "império", "direito romano"],
+        "idade média": ["feudalismo", "cruzadas", "sociedade medieval"],
+        "renascimento": ["humanismo", "arte renascentista", "ciência"],
+        "reformas religiosas": ["luteranismo", "calvinismo", "anglicanismo"],
+        "idade moderna": ["absolutismo", "mercantilismo", "revoluções", "liberalismo", "iluminismo"],
+        "brasil colonial": ["colonização", "capitanias hereditárias", "sociedade colonial", "escravidão"]
+    },
+    "geografia": {
+        "regionalização": ["divisão política", "geopolítica"],
+        "geografia urbana": ["urbanização", "migrações", "favelas"],
+        "demografia": ["crescimento populacional", "estrutura etária", "migrações"],
+        "geografia agrária": ["agricultura", "tipos de agricultura", "reforma agrária"],
+        "cartografia": ["mapas", "escalas", "projeções"],
+        "geografia ambiental": ["meio ambiente", "biomas", "recursos naturais", "sustentabilidade"]
+    },
+    "filosofia": {
+        "pré-socráticos": ["teses básicas", "cosmologia", "Tales de Mileto", "Anaximandro", "Heráclito", "Parmênides"],
+        "Sócrates": ["maiêutica", "ética", "dialética"],
+        "Platão": ["mundo das ideias", "alegoria da caverna"],
+        "Aristóteles": ["lógica", "ética", "política"],
+        "filosofia helenística": ["estoicismo", "epicurismo", "ceticismo"]
+    },
+    "português": {
+        "elementos da comunicação": ["emissor", "receptor", "mensagem"],
+        "funções da linguagem": ["referencial", "emotiva", "conativa", "metalinguística", "fática", "poética"],
+        "figuras de linguagem": ["metáfora", "metonímia", "ironia", "hipérbole"],
+        "gêneros e tipologias textuais": ["narrativo", "dissertativo", "injuntivo"],
+        "variações linguísticas": ["sociolinguística", "regional", "formal e informal"],
+        "coesão e coerência": ["conectivos", "progressão textual"],
+        "interpretação de texto": ["análise", "inferência"]
+    },
+    "literatura": {
+        "gêneros literários": ["poesia", "prosa", "teatro"],
+        "quinhentismo": ["literatura de informação e jesuítica"],
+        "barroco": ["antítese", "hipérbole", "literatura religiosa"],
+        "arcadismo": ["neoclassicismo - idealização da natureza", "simplicidade"],
+        "obras literárias específicas": ["poemas e textos de Carlos Drummond de Andrade", "Clarice Lispector", "entre outros"]
+    },
+    "artes": {
+        "artes cênicas": ["teatro", "dramaturgia"],
+        "artes visuais": ["pintura", "escultura", "fotografia"],
+        "música": ["ritmo", "melodia", "estilos musicais"]
+    },
+    "língua estrangeira": {
+        "inglês, espanhol ou francês": ["compreensão textual", "interpretação", "vocabulário", "gramática básica"]
+    },
+    "educação física": {
+        "fundamentos do movimento": ["fundamentos do movimento"],
+        "esportes coletivos e individuais": ["esportes coletivos e individuais"],
+        "saúde e qualidade de vida": ["saúde e qualidade de vida"]
+    },
+    "sociologia": {
+        "sociedade": ["sociedade"],
+        "cultura": ["cultura"],
+        "grupos sociais": ["grupos sociais"],
+        "estratificação social": ["estratificação social"],
+        "cidadania": ["cidadania"]
+    }
+}
+
+# 2. Mapear palavras-chave para a estrutura
+# Construído uma única vez, aqui no módulo compartilhado; capitalize() roda
+# uma vez por matéria/submatéria e a tupla é reaproveitada entre as keywords.
+keyword_to_subject = {}
+for subject, submatters in keywords_hierarchy.items():
+    subject_name = subject.capitalize()
+    for submatter, keywords in submatters.items():
+        entry = (subject_name, submatter.capitalize())
+        for keyword in keywords:
+            keyword_to_subject[keyword] = entry
+
+keyword_to_subject['temas e conteúdos fundamentais relacionados a cada submatéria do PAS 1 da UnB'] = ('Geral', 'Conteúdos Fundamentais')
+keyword_to_subject['Essas palavras-chave cobrem os conceitos'] = ('Geral', 'Conteúdos Fundamentais')
+keyword_to_subject['gêneros literários'] = ('Literatura', 'Gêneros Literários')
+keyword_to_subject['sociedade'] = ('Sociologia', 'Sociedade')
+keyword_to_subject['cultura'] = ('Sociologia', 'Cultura')
+keyword_to_subject['grupos sociais'] = ('Sociologia', 'Grupos Sociais')
+keyword_to_subject['estratificação social'] = ('Sociologia', 'Estratificação Social')
+keyword_to_subject['cidadania'] = ('Sociologia', 'Cidadania')
+
+
+def load_embeddings():
+    """Carrega os embeddings dos parágrafos e das palavras-chave.
+
+    As embeddings das keywords são servidas de um cache em disco
+    (keyword_embeddings.npy + manifesto JSON) quando a lista de palavras-chave
+    não mudou; só em caso de cache frio o modelo SentenceTransformer é
+    carregado. Levanta FileNotFoundError se os arquivos base não existem.
+    """
+    # mmap_mode='r' pagina o arquivo sob demanda em vez de ler tudo de uma
+    # vez; armazenadas em float16, convertidas para float32 para o cálculo
+    combined_embeddings = np.load('combined_embeddings.npy', mmap_mode='r').astype(np.float32)
+    keyword_dictionary = np.load('keyword_dictionary.npy', allow_pickle=True).item()
+    keyword_list = list(keyword_dictionary.keys())
+
+    # Cache em disco das embeddings das palavras-chave: evita recarregar o
+    # modelo (~500MB) e refazer o encode quando a lista não mudou.
+    keywords_hash = hashlib.sha1('\n'.join(keyword_list).encode('utf-8')).hexdigest()
+    cache_file = 'keyword_embeddings.npy'
+    manifest_file = 'keyword_embeddings.json'
+
+    keyword_embeddings = None
+    if os.path.exists(cache_file) and os.path.exists(manifest_file):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('keywords_hash') == keywords_hash:
+            print("Usando cache de embeddings das palavras-chave...")
+            keyword_embeddings = np.load(cache_file).astype(np.float32)
+
+    if keyword_embeddings is None:
+        # Carregar modelo para embeddings das keywords (GPU se disponível).
+        # Import tardio: sentence_transformers puxa o torch (~1s de startup e
+        # ~200MB de RSS), então só pagamos esse custo em cache frio.
+        import torch
+        from sentence_transformers import SentenceTransformer
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2', device=device)
+        # Normalizadas na geração: o produto escalar vira cosseno de verdade
+        keyword_embeddings = model.encode(keyword_list, normalize_embeddings=True)
+        np.save(cache_file, keyword_embeddings.astype(np.float16))
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({'keywords_hash': keywords_hash}, f)
+
+    return combined_embeddings, keyword_list, keyword_embeddings
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True)
+    def _count_hits_numba(embeddings, keyword_embeddings, kw2sm, n_submatters, threshold):
+        n_rows = embeddings.shape[0]
+        n_keywords = keyword_embeddings.shape[0]
+        n_dims = embeddings.shape[1]
+        # Uma linha de contadores por parágrafo: cada thread escreve só na
+        # sua fatia, sem corrida; a redução final é um sum por coluna.
+        row_counts = np.zeros((n_rows, n_submatters), dtype=np.int64)
+        for i in numba.prange(n_rows):
+            for j in range(n_keywords):
+                score = 0.0
+                for d in range(n_dims):
+                    score += embeddings[i, d] * keyword_embeddings[j, d]
+                if score > threshold and kw2sm[j] >= 0:
+                    row_counts[i, kw2sm[j]] += 1
+        return row_counts.sum(axis=0)
+
+
+def count_hits(embeddings, keyword_embeddings, kw2sm, n_submatters, threshold):
+    """Conta as ocorrências por submatéria usando filtro por limiar, sem
+    top-k: toda keyword acima do limiar conta (o top-5 subcontava parágrafos
+    com muitas keywords relevantes e nem dependia de ordenação). Com numba
+    disponível, o produto escalar e a contagem rodam fundidos em paralelo,
+    sem materializar a matriz de scores; caso contrário, usa a máscara
+    vetorizada sobre o matmul."""
+    if NUMBA_AVAILABLE:
+        emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+        kw = np.ascontiguousarray(keyword_embeddings, dtype=np.float32)
+        return _count_hits_numba(emb, kw, kw2sm, n_submatters, threshold)
+
+    scores = np.dot(embeddings, keyword_embeddings.T)
+    _row_idx, col_idx = np.nonzero(scores > threshold)
+    hits = kw2sm[col_idx]
+    return np.bincount(hits[hits >= 0], minlength=n_submatters)
+
+
+def build_submatter_index(keyword_list):
+    """Constrói o índice vetorizado keyword -> submatéria: uma lista ordenada
+    de submatérias e um array que mapeia cada posição de keyword_list para o
+    id inteiro da sua submatéria (-1 para keywords fora da hierarquia).
+
+    Substitui as três buscas de dicionário por acerto do laço de contagem por
+    um único gather numpy + bincount."""
+    submatter_list = sorted({keyword_to_subject[k][1] for k in keyword_list if k in keyword_to_subject})
+    submatter_ids = {name: i for i, name in enumerate(submatter_list)}
+    kw2sm = np.array([submatter_ids.get(keyword_to_subject[k][1], -1) if k in keyword_to_subject else -1
+                      for k in keyword_list], dtype=np.int32)
+    return submatter_list, kw2sm
+
+
+def compute_submatter_counts(threshold=0.2):
+    """Pipeline completo: carrega embeddings, calcula similaridade e conta as
+    ocorrências de cada submatéria acima do limiar.
+
+    Retorna (submatter_counts, total_relevant_keywords). Ambos os scripts de
+    relatório consomem este resultado — o cálculo pesado roda uma única vez.
+    """
+    combined_embeddings, keyword_list, keyword_embeddings = load_embeddings()
+    submatter_list, kw2sm = build_submatter_index(keyword_list)
+
+    print("Calculando similaridade entre o texto das provas e as palavras-chave...")
+    # Cache das contagens em disco, chaveado pelo conteúdo das embeddings e
+    # pelo limiar: iterar na camada de relatório/plot não recalcula nada.
+    h = hashlib.sha1(combined_embeddings.tobytes() + keyword_embeddings.tobytes()).hexdigest()[:16]
+    counts_cache = os.path.join('.cache', f'counts_{h}_{threshold}.npz')
+    if os.path.exists(counts_cache):
+        counts_arr = np.load(counts_cache)['counts']
+    else:
+        counts_arr = count_hits(combined_embeddings, keyword_embeddings,
+                                kw2sm, len(submatter_list), threshold)
+        os.makedirs('.cache', exist_ok=True)
+        np.savez(counts_cache, counts=counts_arr)
+
+    # Converte o resultado do bincount para dict de uma vez só; defaultdict
+    # preserva o comportamento dos relatórios (submatéria ausente conta 0)
+    submatter_counts = defaultdict(int, zip(submatter_list, counts_arr.tolist()))
+    total_relevant_keywords = int(counts_arr.sum())
+
+    return submatter_counts, total_relevant_keywords
@@ -1,10 +1,81 @@
+import itertools
 import numpy as np
 import os
-from sentence_transformers import SentenceTransformer
+
+# Modelo exportado para ONNX com quantização dinâmica INT8. Para gerar:
+#   optimum-cli export onnx --model sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2 \
+#       --task feature-extraction onnx_model/
+#   python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \
+#       quantize_dynamic('onnx_model/model.onnx', 'onnx_model/model_int8.onnx', weight_type=QuantType.QInt8)"
+ONNX_MODEL_PATH = 'onnx_model/model_int8.onnx'
+
+
+class OnnxEncoder:
+    """Encoder fino sobre o ONNX Runtime: tokeniza em lotes, roda a sessão
+    INT8 na CPU e aplica mean pooling + normalização — mesmo contrato de
+    encode() do SentenceTransformer, com ~2-4x mais throughput na CPU e
+    ~4x menos memória de modelo."""
+
+    def __init__(self, model_path):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+        self.session = ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, sentences, batch_size=64, show_progress_bar=False,
+               convert_to_numpy=True, normalize_embeddings=True):
+        chunks = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start:start + batch_size]
+            encoded = self.tokenizer(batch, padding=True, truncation=True,
+                                     max_length=128, return_tensors='np')
+            inputs = {k: v for k, v in encoded.items() if k in self.input_names}
+            token_embeddings = self.session.run(None, inputs)[0]
+            # Mean pooling ponderado pela attention mask
+            mask = encoded['attention_mask'][:, :, None].astype(np.float32)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+            chunks.append(embeddings.astype(np.float32))
+        return np.vstack(chunks)
+
+
+def iter_paragraphs(path):
+    """Lê o arquivo linha a linha e produz um parágrafo por vez (blocos
+    separados por linha em branco), sem carregar o texto inteiro na memória."""
+    buffer = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                buffer.append(line)
+            elif buffer:
+                paragraph = ''.join(buffer).strip()
+                if paragraph:
+                    yield paragraph
+                buffer = []
+    if buffer:
+        paragraph = ''.join(buffer).strip()
+        if paragraph:
+            yield paragraph
 
 # 1. Carregar o modelo de embedding
-print("Carregando o modelo de linguagem. Isso pode levar alguns segundos...")
-model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
+# Preferência pelo modelo ONNX INT8 quando exportado (inferência mais rápida
+# na CPU); caso contrário, SentenceTransformer com GPU quando disponível —
+# o encode roda ordens de magnitude mais rápido que na CPU, e em fp16 ganha
+# ainda mais sem perda relevante de precisão.
+if os.path.exists(ONNX_MODEL_PATH):
+    print("Carregando o modelo ONNX quantizado (INT8)...")
+    model = OnnxEncoder(ONNX_MODEL_PATH)
+else:
+    import torch
+    from sentence_transformers import SentenceTransformer
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    print(f"Carregando o modelo de linguagem (device: {device}). Isso pode levar alguns segundos...")
+    model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2', device=device)
+    if device == 'cuda':
+        model.half()
 
 # Define o nome e o caminho do arquivo de texto combinado
 # Ele agora procura na pasta atual, onde você está.
@@ -15,22 +86,44 @@ if not os.path.exists(text_file_path):
     print("Execute o script 'process_all_pdfs.py' primeiro para criar o arquivo.")
     exit()
 
-# 2. Ler o texto e dividir em parágrafos
-with open(text_file_path, 'r', encoding='utf-8') as f:
-    text = f.read()
-
-# Dividir o texto em parágrafos e remover espaços extras
-paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+# 2. Ler e codificar os parágrafos em streaming
+# O texto é consumido em blocos de CHUNK_SIZE parágrafos: a memória fica
+# limitada ao bloco corrente e a codificação começa antes de o arquivo
+# inteiro ser lido.
+#
+# "Smart batching": dentro de cada bloco, os parágrafos são ordenados por
+# tamanho antes de codificar, para que cada lote agrupe textos de comprimento
+# parecido e quase não gaste computação com tokens de padding. Depois a
+# permutação é desfeita.
+# normalize_embeddings=True: com vetores unitários, o produto escalar usado
+# nos scripts de análise passa a ser a similaridade do cosseno de verdade.
+CHUNK_SIZE = 2048
 
-print(f"✅ Texto lido com sucesso! Total de parágrafos para processar: {len(paragraphs)}")
 print("Gerando embeddings (isso pode demorar, dependendo do número de provas)...")
 
-# 3. Gerar embeddings para cada parágrafo
-embeddings = model.encode(paragraphs, show_progress_bar=True)
+paragraphs = []
+embedding_chunks = []
+paragraph_iter = iter_paragraphs(text_file_path)
+while True:
+    chunk = list(itertools.islice(paragraph_iter, CHUNK_SIZE))
+    if not chunk:
+        break
+    order = np.argsort([len(p) for p in chunk])
+    sorted_chunk = [chunk[i] for i in order]
+    chunk_embeddings = model.encode(sorted_chunk, batch_size=64, show_progress_bar=True,
+                                    convert_to_numpy=True, normalize_embeddings=True)
+    embedding_chunks.append(chunk_embeddings[np.argsort(order)])
+    paragraphs.extend(chunk)
+
+print(f"✅ Texto lido com sucesso! Total de parágrafos processados: {len(paragraphs)}")
+
+embeddings = np.vstack(embedding_chunks)
 
 # 4. Salvar os embeddings e o texto original
+# float16 no disco: metade do espaço e da banda de memória ao carregar,
+# sem perda perceptível para similaridade de cosseno em 384 dimensões.
 np.save('combined_paragraphs.npy', paragraphs, allow_pickle=True)
-np.save('combined_embeddings.npy', embeddings, allow_pickle=True)
+np.save('combined_embeddings.npy', embeddings.astype(np.float16), allow_pickle=True)
 
 print("\n✅ Processo concluído!")
 print(f"Embeddings salvos em 'combined_embeddings.npy'")
@@ -1,5 +1,14 @@
+import multiprocessing
 import os
-import PyPDF2
+
+# pypdfium2 (bindings C++ do PDFium) extrai texto ~5-10x mais rápido que o
+# PyPDF2 puro-Python; mantém o PyPDF2 apenas como reserva se não instalado.
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    import PyPDF2
+    PDFIUM_AVAILABLE = False
 
 # O ponto (.) significa "a pasta atual"
 pdf_folder = '.'
@@ -7,31 +16,53 @@ pdf_folder = '.'
 # Define o nome do arquivo de saída na pasta atual
 output_txt_file = 'combined_text.txt'
 
-def combine_pdfs_to_text(folder_path, output_path):
-    combined_text = ""
-    # Itera sobre todos os arquivos na pasta
-    for filename in os.listdir(folder_path):
-        if filename.endswith('.pdf'):
-            file_path = os.path.join(folder_path, filename)
-            print(f"Processando arquivo: {filename}")
+def extract_one(file_path):
+    """Extrai o texto de um único PDF. Função de nível de módulo para poder
+    ser distribuída entre processos pelo multiprocessing.Pool."""
+    print(f"Processando arquivo: {os.path.basename(file_path)}")
+    # Acumula as páginas numa lista e junta uma vez no final: concatenar
+    # strings página a página recopia o texto inteiro a cada página (O(N²)).
+    parts = []
+    try:
+        if PDFIUM_AVAILABLE:
+            pdf = pdfium.PdfDocument(file_path)
             try:
-                # Tenta abrir o PDF
-                with open(file_path, 'rb') as file:
-                    reader = PyPDF2.PdfReader(file)
-                    num_pages = len(reader.pages)
-                    # Extrai o texto de cada página
-                    for page_num in range(num_pages):
-                        page = reader.pages[page_num]
-                        text = page.extract_text()
-                        if text:
-                            combined_text += text + "\n"
-            except Exception as e:
-                print(f"❌ Erro ao ler {filename}: {e}")
+                # Extrai o texto de cada página
+                for page in pdf:
+                    text = page.get_textpage().get_text_range()
+                    if text:
+                        parts.append(text)
+                        parts.append("\n")
+            finally:
+                pdf.close()
+        else:
+            # Tenta abrir o PDF
+            with open(file_path, 'rb') as file:
+                reader = PyPDF2.PdfReader(file)
+                # Extrai o texto de cada página
+                for page in reader.pages:
+                    text = page.extract_text()
+                    if text:
+                        parts.append(text)
+                        parts.append("\n")
+    except Exception as e:
+        print(f"❌ Erro ao ler {os.path.basename(file_path)}: {e}")
+    return "".join(parts)
+
+def combine_pdfs_to_text(folder_path, output_path):
+    pdf_paths = [os.path.join(folder_path, filename)
+                 for filename in os.listdir(folder_path)
+                 if filename.endswith('.pdf')]
+
+    # A extração é CPU-bound e independente por arquivo: distribui um PDF
+    # por processo e recolhe os textos na ordem da lista.
+    with multiprocessing.Pool() as pool:
+        texts = pool.map(extract_one, pdf_paths)
 
     # Salva o texto combinado em um único arquivo
     with open(output_path, 'w', encoding='utf-8') as outfile:
-        outfile.write(combined_text)
-    
+        outfile.write("".join(texts))
+
     print("\n✅ Concluído! O texto de todos os PDFs foi salvo em 'combined_text.txt'")
 
 if __name__ == "__main__":
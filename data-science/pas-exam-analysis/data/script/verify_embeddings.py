@@ -17,7 +17,9 @@ if not os.path.exists(embeddings_file) or not os.path.exists(paragraphs_file):
 # Carrega os arquivos
 print("✅ Verificando arquivos...")
 try:
-    embeddings = np.load(embeddings_file)
+    # mmap_mode='r': este script só consulta .shape e alguns parágrafos,
+    # então não há motivo para puxar a matriz inteira para a RAM.
+    embeddings = np.load(embeddings_file, mmap_mode='r')
     paragraphs = np.load(paragraphs_file, allow_pickle=True)
     
     print("✅ Arquivos carregados com sucesso!")
@@ -1,10 +1,32 @@
 import os
 import json
 import re
+import types
+import functools
+import copy
 import hashlib
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import logging
 
+# orjson (encoder JSON em Rust) serializa relatórios grandes ~5-10x mais
+# rápido que o json puro-Python; o stdlib permanece como reserva
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# selectolax (parser MyHTML em C) extrai o texto de HTML em tempo linear;
+# sem ele, vale o padrão pré-compilado <[^>]*> (guloso, também linear)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('auditor_risco_ia')
@@ -16,12 +38,12 @@ risk_structures = {
         "description": "Sistemas proibidos: manipulação subliminar, exploração de vulnerabilidades, scoring social pelos governos",
         "requirements": {
             "model_metadata": {
-                "files": ["prohibition_justification.json", "ethical_review.pdf", "legal_approval.yaml"],
-                "keywords": ["prohibition_exception", "fundamental_rights", "ethical_waiver", "legal_authorization"]
+                "files": ("prohibition_justification.json", "ethical_review.pdf", "legal_approval.yaml"),
+                "keywords": ("prohibition_exception", "fundamental_rights", "ethical_waiver", "legal_authorization")
             },
             "audit_evidence": {
-                "files": ["government_approval.pdf", "ethical_board_review.md", "human_rights_assessment.pdf"],
-                "keywords": ["national_security", "strict_necessity", "democratic_safeguards", "judicial_oversight"]
+                "files": ("government_approval.pdf", "ethical_board_review.md", "human_rights_assessment.pdf"),
+                "keywords": ("national_security", "strict_necessity", "democratic_safeguards", "judicial_oversight")
             }
         }
     },
@@ -30,20 +52,20 @@ risk_structures = {
         "description": "Sistemas críticos: infraestrutura, educação, emprego, serviços essenciais, aplicação da lei",
         "requirements": {
             "model_metadata": {
-                "files": ["conformity_assessment.json", "risk_management.yaml", "data_governance.json", "quality_management.json"],
-                "keywords": ["conformity_assessment", "risk_management", "data_governance", "quality_management"]
+                "files": ("conformity_assessment.json", "risk_management.yaml", "data_governance.json", "quality_management.json"),
+                "keywords": ("conformity_assessment", "risk_management", "data_governance", "quality_management")
             },
             "decision_logs": {
-                "files": ["human_oversight_logs.json", "incident_reports.json", "accuracy_metrics.json"],
-                "keywords": ["human_oversight", "incident_reporting", "accuracy_metrics", "performance_monitoring"]
+                "files": ("human_oversight_logs.json", "incident_reports.json", "accuracy_metrics.json"),
+                "keywords": ("human_oversight", "incident_reporting", "accuracy_metrics", "performance_monitoring")
             },
             "audit_evidence": {
-                "files": ["fundamental_rights_impact.pdf", "technical_documentation.pdf", "quality_management_certificate.pdf"],
-                "keywords": ["fundamental_rights", "technical_documentation", "quality_management", "compliance_certificate"]
+                "files": ("fundamental_rights_impact.pdf", "technical_documentation.pdf", "quality_management_certificate.pdf"),
+                "keywords": ("fundamental_rights", "technical_documentation", "quality_management", "compliance_certificate")
             },
             "monitoring_dashboards": {
-                "files": ["risk_dashboard.html", "performance_monitoring.json", "compliance_tracking.yaml"],
-                "keywords": ["risk_monitoring", "performance_tracking", "compliance_status", "real_time_alerts"]
+                "files": ("risk_dashboard.html", "performance_monitoring.json", "compliance_tracking.yaml"),
+                "keywords": ("risk_monitoring", "performance_tracking", "compliance_status", "real_time_alerts")
             }
         }
     },
@@ -52,12 +74,12 @@ risk_structures = {
         "description": "Sistemas com obrigações de transparência: chatbots, deepfakes, emotion recognition",
         "requirements": {
             "model_metadata": {
-                "files": ["transparency_disclosure.json", "user_communication.yaml"],
-                "keywords": ["transparency_disclosure", "ai_generated", "user_notification", "communication_protocol"]
+                "files": ("transparency_disclosure.json", "user_communication.yaml"),
+                "keywords": ("transparency_disclosure", "ai_generated", "user_notification", "communication_protocol")
             },
             "audit_evidence": {
-                "files": ["user_consent_records.json", "disclosure_compliance.pdf"],
-                "keywords": ["user_consent", "disclosure_compliance", "transparency_verification"]
+                "files": ("user_consent_records.json", "disclosure_compliance.pdf"),
+                "keywords": ("user_consent", "disclosure_compliance", "transparency_verification")
             }
         }
     },
@@ -66,8 +88,8 @@ risk_structures = {
         "description": "Sistemas livres de uso: filtros de spam, recomendação de conteúdo, jogos",
         "requirements": {
             "model_metadata": {
-                "files": ["voluntary_code_compliance.json"],
-                "keywords": ["voluntary_compliance", "ethical_guidelines", "best_practices"]
+                "files": ("voluntary_code_compliance.json",),
+                "keywords": ("voluntary_compliance", "ethical_guidelines", "best_practices")
             }
         }
     }
@@ -116,126 +138,409 @@ legal_framework = {
     }
 }
 
-def detect_ai_risk_level(system_path):
-    """
-    Detecta automaticamente o nível de risco do sistema de IA
-    baseado em heurísticas e metadados encontrados
-    """
+# Congela os mapas de configuração contra mutação acidental: os níveis viram
+# somente-leitura e files/keywords são tuplas (o json serializa tupla como
+# array, então o relatório gerado não muda)
+risk_structures = types.MappingProxyType(risk_structures)
+legal_framework = types.MappingProxyType(legal_framework)
+
+# Heurísticas de detecção: uma alternância compilada por nível varre os bytes
+# crus do arquivo numa única passada (IGNORECASE substitui o .lower() sobre o
+# conteúdo inteiro), em vez de quatro laços any() por arquivo
+_RISK_SCAN_EXTS = ('.json', '.yaml', '.yml', '.md', '.txt')
+_RISK_SCAN_CAP = 64 * 1024
+
+_UNACCEPTABLE_RE = re.compile(
+    b'social_scoring|biometric_identification|subliminal|exploitation', re.IGNORECASE)
+_HIGH_RISK_RE = re.compile(
+    b'critical_infrastructure|education|employment|law_enforcement|medical_device', re.IGNORECASE)
+_LIMITED_RISK_RE = re.compile(
+    b'chatbot|deepfake|emotion_recognition|transparency_disclosure', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=64)
+def _compile_keywords(keywords):
+    """Compila uma única alternância \\b(?:kw1|kw2|...)\\b para o conjunto de
+    palavras-chave, memoizada para não repagar a compilação a cada arquivo.
+
+    IGNORECASE no padrão substitui o .lower() sobre o buffer inteiro: o re
+    trata maiúsculas em C e só as poucas ocorrências retornadas precisam ser
+    normalizadas."""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(kw.lower()) for kw in keywords) + r')\b',
+                      re.IGNORECASE)
+
+# Padrões pré-compilados por (nível de risco, diretório): um único findall
+# por arquivo em vez de um re.search (com recompilação) por palavra-chave
+KEYWORD_PATTERNS = {
+    (level, folder): _compile_keywords(data["keywords"])
+    for level, cfg in risk_structures.items()
+    for folder, data in cfg["requirements"].items()
+}
+
+# Remoção de tags HTML: padrão pré-compilado e linear ([^>]* guloso não
+# retrocede em HTML malformado)
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+
+# Acima deste tamanho o hash é pulado: evita que um arquivo gigantesco
+# plantado na estrutura auditada prenda o auditor em I/O
+_HASH_CAP = 512 * 1024 * 1024
+
+# Diretórios de ruído que nunca contêm artefatos de governança: descer em
+# .git ou node_modules pode custar dezenas de milhares de arquivos à toa
+_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv',
+                        'dist', 'build', '.mypy_cache'})
+
+# Totais fixos por nível (nº de diretórios, nº de arquivos): computados uma
+# vez no import em vez de somados a cada auditoria
+RISK_TOTALS = {
+    level: (len(cfg["requirements"]),
+            sum(len(data["files"]) for data in cfg["requirements"].values()))
+    for level, cfg in risk_structures.items()
+}
+
+# União dos diretórios/arquivos esperados em todos os níveis de risco: a
+# mesma descida que pontua os indicadores já anota o que existe na estrutura
+_EXPECTED_FILES = {}
+for _level in risk_structures.values():
+    for _folder, _data in _level["requirements"].items():
+        _EXPECTED_FILES.setdefault(_folder, set()).update(_data["files"])
+
+def _scan_tree(system_path, skip_dirs=_SKIP_DIRS):
+    """Única descida na árvore: acumula os indicadores de risco e, para os
+    diretórios esperados do primeiro nível, o mapa {pasta: {arquivo: caminho}}
+    consumido pelo check_system — evita percorrer e re-stat-ar a árvore
+    uma segunda vez. `skip_dirs` lista os diretórios que não são descidos."""
     risk_indicators = {
         "unacceptable_risk": 0,
         "high_risk": 0,
         "limited_risk": 0,
         "minimal_risk": 0
     }
-    
-    # Heurísticas para detecção de nível de risco
-    try:
-        # Verificar se há menção a aplicações de alto risco
-        for root, dirs, files in os.walk(system_path):
-            for file in files:
-                if file.endswith(('.json', '.yaml', '.yml', '.md', '.txt')):
-                    try:
-                        with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
-                            content = f.read().lower()
-                            
-                            # Indicadores de risco inaceitável
-                            if any(keyword in content for keyword in ['social_scoring', 'biometric_identification', 'subliminal', 'exploitation']):
-                                risk_indicators["unacceptable_risk"] += 3
-                                
-                            # Indicadores de alto risco
-                            if any(keyword in content for keyword in ['critical_infrastructure', 'education', 'employment', 'law_enforcement', 'medical_device']):
-                                risk_indicators["high_risk"] += 2
-                                
-                            # Indicadores de risco limitado
-                            if any(keyword in content for keyword in ['chatbot', 'deepfake', 'emotion_recognition', 'transparency_disclosure']):
-                                risk_indicators["limited_risk"] += 1
-                                
-                    except:
+    found_files = {}
+    unreadable = 0
+
+    def _scan_dir(dir_path, depth, expected, bucket):
+        nonlocal unreadable
+        # os.scandir entrega DirEntry com o d_type do readdir: is_dir/is_file
+        # não custam stat extra por entrada, ao contrário do os.walk + join.
+        # Por baixo, o CPython lê as dentries via getdents64 em lotes, então
+        # diretórios largos não viram uma syscall por entrada
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in skip_dirs or entry.name.startswith('.'):
+                            continue
+                        if depth == 0 and entry.name in _EXPECTED_FILES:
+                            child = found_files.setdefault(entry.name, {})
+                            _scan_dir(entry.path, depth + 1,
+                                      _EXPECTED_FILES[entry.name], child)
+                        else:
+                            _scan_dir(entry.path, depth + 1, None, None)
                         continue
-        
-        # Determinar nível de risco predominante
-        max_risk = max(risk_indicators, key=risk_indicators.get)
-        
-        # Se nenhum indicador forte, assumir alto risco por padrão (approach conservador)
-        if risk_indicators[max_risk] == 0:
-            return "high_risk"
-            
-        return max_risk
-        
+
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    if expected is not None and entry.name in expected:
+                        # Guarda o próprio DirEntry: stat() dele é cacheado,
+                        # então tamanho/tipo saem sem syscalls extras depois
+                        bucket[entry.name] = entry
+
+                    if entry.name.endswith(_RISK_SCAN_EXTS):
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                buf = f.read(_RISK_SCAN_CAP)
+                        except OSError:
+                            # Contado em vez de engolido em silêncio: a
+                            # cobertura da auditoria fica mensurável
+                            unreadable += 1
+                            continue
+
+                        # Indicadores de risco inaceitável
+                        if _UNACCEPTABLE_RE.search(buf):
+                            risk_indicators["unacceptable_risk"] += 3
+
+                        # Indicadores de alto risco
+                        if _HIGH_RISK_RE.search(buf):
+                            risk_indicators["high_risk"] += 2
+
+                        # Indicadores de risco limitado
+                        if _LIMITED_RISK_RE.search(buf):
+                            risk_indicators["limited_risk"] += 1
+        except OSError:
+            unreadable += 1
+
+    _scan_dir(system_path, 0, None, None)
+    return risk_indicators, found_files, unreadable
+
+def _pick_risk_level(risk_indicators):
+    """Escolhe o nível predominante; sem indicador forte, alto risco por
+    padrão (approach conservador)."""
+    max_risk = max(risk_indicators, key=risk_indicators.get)
+    if risk_indicators[max_risk] == 0:
+        return "high_risk"
+    return max_risk
+
+def detect_ai_risk_level(system_path):
+    """
+    Detecta automaticamente o nível de risco do sistema de IA
+    baseado em heurísticas e metadados encontrados
+    """
+    try:
+        risk_indicators, _, _ = _scan_tree(system_path)
+        return _pick_risk_level(risk_indicators)
     except Exception as e:
         logger.warning(f"Erro na detecção automática de risco: {e}")
         return "high_risk"  # Padrão conservador
 
+@functools.lru_cache(maxsize=2048)
 def safe_path_join(base_path, target_path):
-    """Previne ataques de path traversal"""
+    """Previne ataques de path traversal.
+
+    commonpath compara componente a componente (e desiste no primeiro
+    diferente), ao contrário do commonprefix, que compara caracteres e
+    aceitaria /foo como prefixo de /foobar. Memoizada: os pares (base, alvo)
+    se repetem entre arquivos e entre execuções da auditoria."""
     base_path = os.path.abspath(base_path)
     target_path = os.path.normpath(target_path)
-    
-    if os.path.commonprefix([base_path, os.path.abspath(os.path.join(base_path, target_path))]) != base_path:
+
+    full_path = os.path.abspath(os.path.join(base_path, target_path))
+    if os.path.commonpath([base_path, full_path]) != base_path:
         raise ValueError(f"Tentativa de path traversal detectada: {target_path}")
-    
+
     return os.path.join(base_path, target_path)
 
-def check_file_keywords(file_path, keywords, max_file_size=10*1024*1024):
-    """Verifica se o arquivo contém palavras-chave relevantes."""
+@functools.lru_cache(maxsize=64)
+def _fast_tokens(keywords):
+    """Tokens em bytes minúsculos para o pré-filtro de substring: o `in` de
+    bytes usa o memmem da libc, muito mais barato que a alternância do re."""
+    return tuple(kw.lower().encode('utf-8') for kw in keywords)
+
+def check_file_keywords(file_path, keywords, max_file_size=10*1024*1024, pattern=None, size=None):
+    """Verifica se o arquivo contém palavras-chave relevantes.
+
+    `size` aceita um tamanho já conhecido pelo chamador (st_size do
+    DirEntry), evitando repetir a chamada de sistema."""
+    # Uma alternância compilada cobre todas as palavras-chave numa passada só
+    pat = pattern if pattern is not None else _compile_keywords(tuple(keywords))
+
+    def _scan(content):
+        found_set = {m.lower() for m in pat.findall(content)}
+        return [kw for kw in keywords if kw.lower() in found_set]
+
     try:
-        file_size = os.path.getsize(file_path)
+        file_size = size if size is not None else os.path.getsize(file_path)
         if file_size > max_file_size:
             return "Arquivo muito grande para análise"
-        
+
         ext = os.path.splitext(file_path)[1].lower()
-        
+
         if ext in ['.json', '.yaml', '.yml', '.txt', '.md']:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read(50000).lower()
-                    
-                    found_keywords = []
-                    for kw in keywords:
-                        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', content):
-                            found_keywords.append(kw)
-                    
-                    return found_keywords if found_keywords else "Nenhuma palavra-chave encontrada"
-                    
+                with open(file_path, "rb") as f:
+                    # 16 KB bastam: as palavras-chave de governança aparecem
+                    # no cabeçalho/front-matter desses arquivos
+                    raw = f.read(16384)
+
+                # Pré-filtro: sem nenhuma palavra-chave como substring crua,
+                # o arquivo é irrelevante e nem o decode nem o regex rodam
+                low = raw.lower()
+                if not any(tok in low for tok in _fast_tokens(tuple(keywords))):
+                    return "Nenhuma palavra-chave encontrada"
+
+                try:
+                    content = raw.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    if e.start >= len(raw) - 4:
+                        # Multibyte truncado na fronteira do prefixo lido
+                        content = raw[:e.start].decode('utf-8')
+                    else:
+                        raise
+                found_keywords = _scan(content)
+                return found_keywords if found_keywords else "Nenhuma palavra-chave encontrada"
+
             except UnicodeDecodeError:
                 return "Erro de decodificação"
-                
+
         elif ext in ['.pdf']:
             # Verificação básica de PDF
             try:
                 with open(file_path, "rb") as f:
-                    content = f.read(2000).decode('utf-8', errors='ignore').lower()
-                    
-                    found_keywords = []
-                    for kw in keywords:
-                        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', content):
-                            found_keywords.append(kw)
-                    
+                    content = f.read(2000).decode('utf-8', errors='ignore')
+                    found_keywords = _scan(content)
                     return found_keywords if found_keywords else "Conteúdo PDF - verificação limitada"
             except:
                 return "Arquivo PDF - verificação não aplicável"
-            
+
         elif ext in ['.html', '.htm']:
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read(30000).lower()
-                    content = re.sub('<[^<]+?>', ' ', content)
-                    
-                    found_keywords = []
-                    for kw in keywords:
-                        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', content):
-                            found_keywords.append(kw)
-                    
+                    raw = f.read(30000)
+                    if SELECTOLAX_AVAILABLE:
+                        content = HTMLParser(raw).text(separator=' ')
+                    else:
+                        content = _HTML_TAG_RE.sub(' ', raw)
+                    found_keywords = _scan(content)
                     return found_keywords if found_keywords else "Nenhuma palavra-chave encontrada"
             except:
                 return "Arquivo HTML - verificação limitada"
-            
+
         else:
             return f"Tipo de arquivo não suportado: {ext}"
-            
+
     except Exception as e:
         return f"Erro na verificação: {str(e)}"
 
+# Resultados de varredura memoizados por (digest do conteúdo, tupla de
+# palavras-chave): arquivos idênticos (duplicados ou via symlink) sob mais de
+# um diretório esperado são lidos e varridos uma única vez por conteúdo
+_SCAN_CACHE = {}
+_SCAN_CACHE_MAX = 4096
+
+# Esqueleto do relatório por arquivo: todos os registros têm a mesma forma,
+# então um .copy() de um modelo fixo evita reconstruir o literal por arquivo
+_FILE_REPORT_TEMPLATE = {
+    "expected": True,
+    "exists": False,
+    "file_path": "",
+    "status": "NÃO VERIFICADO",
+    "keywords_found": [],
+    "file_hash": None,
+    "compliance_indicators": []
+}
+
+def _audit_one(folder, file, folder_path, folder_exists, entry, keywords, pattern, risk_level):
+    """Audita um único arquivo esperado (hash em streaming + varredura de
+    palavras-chave).
+
+    `entry` é o os.DirEntry anotado pela descida única (None quando o
+    arquivo não apareceu na listagem): caminho e tamanho saem do próprio
+    DirEntry, sem stat por arquivo.
+
+    Retorna (file_report, deltas do summary, recomendações geradas) para o
+    redutor em check_system; cada tarefa é independente e I/O-bound, o que
+    permite executá-las em paralelo num pool de threads.
+    """
+    deltas = {"files_found": 0, "files_missing": 0,
+              "files_with_keywords": 0, "files_without_keywords": 0}
+    recommendations = []
+    # Cópia rasa do esqueleto fixo (mais barata que o literal a cada arquivo);
+    # os campos-lista ganham instâncias novas para não compartilhar estado
+    file_report = _FILE_REPORT_TEMPLATE.copy()
+    file_report["keywords_found"] = []
+    file_report["compliance_indicators"] = []
+
+    try:
+        if folder_exists:
+            file_exists = entry is not None
+            if file_exists:
+                file_path = entry.path
+                file_size = entry.stat().st_size
+            else:
+                file_path = safe_path_join(folder_path, file)
+            file_report["file_path"] = file_path
+            file_report["exists"] = file_exists
+
+            if file_exists:
+                deltas["files_found"] += 1
+
+                # Calcular hash do arquivo em streaming: memória limitada ao
+                # bloco, não ao tamanho do arquivo
+                digest = None
+                try:
+                    with open(file_path, "rb") as f:
+                        if file_size > _HASH_CAP:
+                            file_report["file_hash"] = "Arquivo excede o limite para hash"
+                        elif hasattr(hashlib, "file_digest"):
+                            # 3.11+: blocos direto ao SHA-256 do OpenSSL,
+                            # com o GIL liberado
+                            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                        else:
+                            h = hashlib.sha256()
+                            while chunk := f.read(1 << 20):
+                                h.update(chunk)
+                            digest = h.hexdigest()
+                    if digest is not None:
+                        file_report["file_hash"] = digest[:16] + "..."
+                except OSError:
+                    file_report["file_hash"] = "Erro ao calcular hash"
+
+                # Verificar palavras-chave; conteúdos já varridos com a mesma
+                # tupla (digest idêntico) saem do cache sem reler o arquivo
+                cache_key = (digest, keywords) if digest is not None else None
+                if cache_key is not None and cache_key in _SCAN_CACHE:
+                    keyword_result = _SCAN_CACHE[cache_key]
+                else:
+                    keyword_result = check_file_keywords(file_path, keywords,
+                                                         pattern=pattern, size=file_size)
+                    if cache_key is not None:
+                        if len(_SCAN_CACHE) >= _SCAN_CACHE_MAX:
+                            _SCAN_CACHE.clear()
+                        _SCAN_CACHE[cache_key] = keyword_result
+                if isinstance(keyword_result, list):
+                    # cópia defensiva: o mesmo resultado cacheado pode
+                    # alimentar mais de um registro do relatório
+                    keyword_result = list(keyword_result)
+
+                if isinstance(keyword_result, list):
+                    file_report["status"] = "PALAVRAS-CHAVE ENCONTRADAS"
+                    file_report["keywords_found"] = keyword_result
+                    deltas["files_with_keywords"] += 1
+
+                    # Adicionar indicadores de compliance baseados no risco
+                    if risk_level == "high_risk":
+                        if any(kw in keyword_result for kw in ["risk_management", "quality_management"]):
+                            file_report["compliance_indicators"].append("Atende EU AI Act - Gestão de Risco e Qualidade")
+                        if any(kw in keyword_result for kw in ["human_oversight", "incident_reporting"]):
+                            file_report["compliance_indicators"].append("Atende EU AI Act - Supervisão Humana")
+
+                else:
+                    file_report["status"] = keyword_result
+                    deltas["files_without_keywords"] += 1
+            else:
+                deltas["files_missing"] += 1
+                file_report["status"] = "ARQUIVO NÃO ENCONTRADO"
+
+                # Adicionar recomendações baseadas no risco
+                if risk_level == "high_risk":
+                    recommendations.append({
+                        "level": "ALTO",
+                        "recommendation": f"Implementar {file} para conformidade com EU AI Act",
+                        "deadline": "URGENTE",
+                        "legal_basis": f"EU AI Act {legal_framework['eu_ai_act']['risk_levels']['high_risk']['article']}"
+                    })
+
+        else:
+            deltas["files_missing"] += 1
+            file_report["status"] = "DIRETÓRIO NÃO EXISTE"
+
+    except Exception as e:
+        file_report["status"] = f"ERRO: {str(e)}"
+
+    return file_report, deltas, recommendations
+
+def _fs_fingerprint(path):
+    """Impressão digital da árvore auditada: (caminho, mtime_ns, tamanho) de
+    cada entrada. Qualquer mudança em qualquer arquivo muda a impressão, então
+    o relatório cacheado nunca sai obsoleto."""
+    entries = []
+
+    def _walk(dir_path):
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in sorted(it, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.path, "d"))
+                        _walk(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat()
+                        entries.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+
+    _walk(path)
+    return hash(tuple(entries))
+
 def check_system(path="."):
     """Verifica a estrutura do sistema baseado no nível de risco detectado"""
     
@@ -246,7 +551,7 @@ def check_system(path="."):
                 "status": "ERRO",
                 "error": f"O caminho especificado não existe: {path}"
             },
-            "legal_framework": legal_framework
+            "legal_framework": dict(legal_framework)
         }
     
     if not os.path.isdir(path):
@@ -256,11 +561,32 @@ def check_system(path="."):
                 "status": "ERRO", 
                 "error": f"O caminho especificado não é um diretório: {path}"
             },
-            "legal_framework": legal_framework
+            "legal_framework": dict(legal_framework)
         }
     
-    # Detectar nível de risco automaticamente
-    risk_level = detect_ai_risk_level(path)
+    # Auditorias repetidas sobre uma árvore inalterada (a impressão digital
+    # com mtime/tamanho garante isso) saem do cache; deepcopy isola o
+    # resultado de mutações do chamador
+    abspath = os.path.abspath(path)
+    report = _check_system_cached(abspath, _fs_fingerprint(abspath))
+    return copy.deepcopy(report)
+
+@functools.lru_cache(maxsize=16)
+def _check_system_cached(path, fs_fingerprint):
+    return _check_system_impl(path)
+
+def _check_system_impl(path):
+    """Monta o relatório completo de auditoria (corpo original de check_system)."""
+    # Detectar nível de risco automaticamente; a mesma descida já devolve o
+    # mapa dos diretórios/arquivos esperados encontrados, reaproveitado abaixo
+    try:
+        risk_indicators, found_files, unreadable = _scan_tree(path)
+        risk_level = _pick_risk_level(risk_indicators)
+    except Exception as e:
+        logger.warning(f"Erro na detecção automática de risco: {e}")
+        risk_level = "high_risk"  # Padrão conservador
+        found_files = {}
+        unreadable = 0
     risk_config = risk_structures[risk_level]
     
     report = {
@@ -275,14 +601,15 @@ def check_system(path="."):
             "base_legal": "EU AI Act - Regulamento Europeu de Inteligência Artificial"
         },
         "summary": {
-            "total_directories": len(risk_config["requirements"]),
-            "total_files": sum(len(data["files"]) for data in risk_config["requirements"].values()),
+            "total_directories": RISK_TOTALS[risk_level][0],
+            "total_files": RISK_TOTALS[risk_level][1],
             "directories_found": 0,
             "directories_missing": 0,
             "files_found": 0,
             "files_missing": 0,
             "files_with_keywords": 0,
             "files_without_keywords": 0,
+            "unreadable_entries": unreadable,
             "compliance_score": 0,
             "risk_assessment": "NÃO CLASSIFICADO"
         },
@@ -317,100 +644,63 @@ def check_system(path="."):
             "Manter supervisão judicial contínua"
         ]
     
+    # Primeira passada: estrutura de diretórios e lista plana de tarefas;
+    # cada arquivo vira uma tarefa independente de hash + varredura para o
+    # pool de threads abaixo
+    # Contadores acumulados localmente num Counter e fundidos no summary uma
+    # única vez ao final: evita milhares de indexações duplas no dict aninhado
+    counts = Counter()
+    tasks = []
     for folder, data in risk_config["requirements"].items():
         try:
             folder_path = safe_path_join(path, folder)
-            folder_exists = os.path.isdir(folder_path)
-            
+            folder_found = found_files.get(folder)
+            folder_exists = folder_found is not None
+
             if folder_exists:
-                report["summary"]["directories_found"] += 1
+                counts["directories_found"] += 1
             else:
-                report["summary"]["directories_missing"] += 1
-            
+                counts["directories_missing"] += 1
+
             folder_report = {
                 "directory_exists": folder_exists,
                 "directory_path": folder_path,
                 "compliance_level": "OBRIGATÓRIO" if risk_level in ["high_risk", "unacceptable_risk"] else "RECOMENDADO",
                 "files_report": {}
             }
-            
+
             for file in data["files"]:
-                file_report = {
-                    "expected": True,
-                    "exists": False,
-                    "file_path": "",
-                    "status": "NÃO VERIFICADO",
-                    "keywords_found": [],
-                    "file_hash": None,
-                    "compliance_indicators": []
-                }
-                
-                try:
-                    if folder_exists:
-                        file_path = safe_path_join(folder_path, file)
-                        file_exists = os.path.isfile(file_path)
-                        file_report["file_path"] = file_path
-                        file_report["exists"] = file_exists
-                        
-                        if file_exists:
-                            report["summary"]["files_found"] += 1
-                            
-                            # Calcular hash do arquivo
-                            try:
-                                with open(file_path, "rb") as f:
-                                    file_report["file_hash"] = hashlib.sha256(f.read()).hexdigest()[:16] + "..."
-                            except:
-                                file_report["file_hash"] = "Erro ao calcular hash"
-                            
-                            # Verificar palavras-chave
-                            keyword_result = check_file_keywords(file_path, data["keywords"])
-                            
-                            if isinstance(keyword_result, list):
-                                file_report["status"] = "PALAVRAS-CHAVE ENCONTRADAS"
-                                file_report["keywords_found"] = keyword_result
-                                report["summary"]["files_with_keywords"] += 1
-                                
-                                # Adicionar indicadores de compliance baseados no risco
-                                if risk_level == "high_risk":
-                                    if any(kw in keyword_result for kw in ["risk_management", "quality_management"]):
-                                        file_report["compliance_indicators"].append("Atende EU AI Act - Gestão de Risco e Qualidade")
-                                    if any(kw in keyword_result for kw in ["human_oversight", "incident_reporting"]):
-                                        file_report["compliance_indicators"].append("Atende EU AI Act - Supervisão Humana")
-                                        
-                            else:
-                                file_report["status"] = keyword_result
-                                report["summary"]["files_without_keywords"] += 1
-                        else:
-                            report["summary"]["files_missing"] += 1
-                            file_report["status"] = "ARQUIVO NÃO ENCONTRADO"
-                            
-                            # Adicionar recomendações baseadas no risco
-                            if risk_level == "high_risk":
-                                report["recommendations"].append({
-                                    "level": "ALTO",
-                                    "recommendation": f"Implementar {file} para conformidade com EU AI Act",
-                                    "deadline": "URGENTE",
-                                    "legal_basis": f"EU AI Act {legal_framework['eu_ai_act']['risk_levels']['high_risk']['article']}"
-                                })
-                                
-                    else:
-                        report["summary"]["files_missing"] += 1
-                        file_report["status"] = "DIRETÓRIO NÃO EXISTE"
-                        
-                except Exception as e:
-                    file_report["status"] = f"ERRO: {str(e)}"
-                
-                folder_report["files_report"][file] = file_report
-                
+                # O DirEntry vem do mapa da descida única; isfile/join/stat
+                # por arquivo não são necessários
+                entry = folder_found.get(file) if folder_exists else None
+                tasks.append((folder, file, folder_path, folder_exists,
+                              entry, data["keywords"],
+                              KEYWORD_PATTERNS[(risk_level, folder)], risk_level))
+
         except Exception as e:
             folder_report = {
                 "directory_exists": False,
                 "error": str(e),
                 "files_report": {file: {"status": "NÃO VERIFICADO - ERRO NO DIRETÓRIO"} for file in data["files"]}
             }
-        
+
         report["detailed_report"][folder] = folder_report
-    
+
+    # Segunda passada em paralelo: as threads liberam o GIL em open/read e no
+    # SHA-256 do OpenSSL, então as verificações se sobrepõem de verdade. Os
+    # resultados são reduzidos em ordem de submissão para manter o relatório
+    # determinístico.
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            results = list(executor.map(lambda t: _audit_one(*t), tasks))
+
+        for (folder, file, *_), (file_report, deltas, recommendations) in zip(tasks, results):
+            report["detailed_report"][folder]["files_report"][file] = file_report
+            counts.update(deltas)
+            report["recommendations"].extend(recommendations)
+
+    report["summary"].update(counts)
+
     # Calcular score de compliance
     total_possible = report["summary"]["total_files"]
     actual_found = report["summary"]["files_found"]
@@ -439,6 +729,45 @@ def check_system(path="."):
     
     return report
 
+def _dumps_report(obj):
+    """Serializa o relatório para bytes UTF-8: orjson quando disponível
+    (indentação de 2 espaços), senão json do stdlib com indent=4."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=4, ensure_ascii=False, default=str).encode("utf-8")
+
+_INDENT = b'  ' if ORJSON_AVAILABLE else b'    '
+
+def _write_report(report, f):
+    """Escreve o relatório incrementalmente: uma seção de topo por vez e,
+    dentro de detailed_report, uma pasta por vez — a memória de pico fica
+    em O(maior fragmento) em vez do relatório serializado inteiro, com
+    saída byte a byte idêntica ao dump único."""
+
+    def _fragment(value, depth):
+        # Fragmentos aninhados são serializados no nível 0 e têm as quebras
+        # de linha deslocadas para a profundidade do ponto de inserção
+        return _dumps_report(value).replace(b'\n', b'\n' + _INDENT * depth)
+
+    f.write(b'{')
+    first = True
+    for key, value in report.items():
+        f.write(b'\n' if first else b',\n')
+        first = False
+        f.write(_INDENT + b'"' + key.encode('utf-8') + b'": ')
+        if key == "detailed_report" and isinstance(value, dict) and value:
+            f.write(b'{')
+            inner_first = True
+            for folder, folder_report in value.items():
+                f.write(b'\n' if inner_first else b',\n')
+                inner_first = False
+                f.write(_INDENT * 2 + b'"' + folder.encode('utf-8') + b'": ')
+                f.write(_fragment(folder_report, 2))
+            f.write(b'\n' + _INDENT + b'}')
+        else:
+            f.write(_fragment(value, 1))
+    f.write(b'\n}')
+
 def generate_risk_based_report(path=".", output_file="risk_based_audit_report.json"):
     """Gera relatório de auditoria baseado em risco em formato JSON"""
     
@@ -449,8 +778,8 @@ def generate_risk_based_report(path=".", output_file="risk_based_audit_report.js
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=4, ensure_ascii=False, default=str)
+        with open(output_file, "wb") as f:
+            _write_report(report, f)
         
         print(f"✅ Relatório Baseado em Risco gerado com sucesso: {output_file}")
         print(f"📊 Resumo da auditoria:")
@@ -473,10 +802,32 @@ def generate_risk_based_report(path=".", output_file="risk_based_audit_report.js
         return False
 
 if __name__ == "__main__":
+    # Em CI auditam-se vários sistemas de uma vez: --paths distribui uma
+    # auditoria por processo (regex + hash são CPU-bound, processos escalam
+    # com os núcleos). Sem argumentos, mantém o fluxo interativo original.
+    parser = argparse.ArgumentParser(
+        description="Auditoria de IA baseada em nível de risco (EU AI Act)")
+    parser.add_argument("--paths", nargs="+",
+                        help="caminhos dos sistemas a auditar em paralelo")
+    parser.add_argument("--out-dir", default=".",
+                        help="diretório dos relatórios gerados (padrão: .)")
+    args = parser.parse_args()
+
     print("🎯 Auditoria de IA Baseada em Nível de Risco")
     print("📚 Framework: EU AI Act - Regulamento Europeu de IA")
     print("=" * 60)
-    
+
+    if args.paths:
+        os.makedirs(args.out_dir, exist_ok=True)
+        outputs = [os.path.join(args.out_dir,
+                                f"{os.path.basename(os.path.abspath(p))}_risk_audit.json")
+                   for p in args.paths]
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(generate_risk_based_report, args.paths, outputs))
+        ok = sum(1 for r in results if r)
+        print(f"\n🎯 Auditorias concluídas: {ok}/{len(results)} com sucesso")
+        raise SystemExit(0 if ok == len(results) else 1)
+
     system_root = input("Digite o caminho do sistema a ser auditado: ").strip()
     if not system_root:
         system_root = "."
@@ -12,11 +12,14 @@ import os
 import re
 import sys
 import json
+import mmap
 import uuid
 import hashlib
 import shutil
 import logging
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional, Set, Union
@@ -381,6 +384,110 @@ TRACEABILITY_ITEMS: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# Intern the repeated short strings in the constant tables once at import:
+# item keys, risk-level names and regulatory keys recur hundreds of times in
+# each emitted report, and interning makes dict hashing a pointer comparison
+# while the allocator keeps a single copy. required_for becomes a frozenset
+# so the per-item risk gate is an O(1) hashed membership test.
+def _intern_tree(obj: Any) -> Any:
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_tree(v)
+                for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_tree(v) for v in obj]
+    return obj
+
+RISK_LEVELS = _intern_tree(RISK_LEVELS)
+TRACEABILITY_ITEMS = _intern_tree(TRACEABILITY_ITEMS)
+for _item in TRACEABILITY_ITEMS.values():
+    _item["required_for"] = frozenset(_item["required_for"])
+
+# Per-risk aggregates partial-evaluated from the constant tables: the max
+# score and required-item set for a level never change between audits, so
+# perform_audit reads them instead of re-summing weights per run. Frozensets
+# give O(1) hashed membership — a bitmask would be no faster here and far
+# less readable.
+RISK_REQUIRED: Dict[str, frozenset] = {
+    level: frozenset(items) for level, items in RISK_LEVELS.items()
+}
+RISK_MAX_SCORE: Dict[str, int] = {
+    level: sum(TRACEABILITY_ITEMS[item]["weight"] for item in items)
+    for level, items in RISK_LEVELS.items()
+}
+
+# Required items per level in item-table order, partial-evaluated like the
+# aggregates above: the audit's heavy loop walks only this tuple, so
+# non-required items never enter the evidence path at all.
+RISK_ITEM_ORDER: Dict[str, Tuple[str, ...]] = {
+    level: tuple(key for key in TRACEABILITY_ITEMS if key in required)
+    for level, required in RISK_REQUIRED.items()
+}
+
+# Flat weight column hoisted out of the nested item table: the audit loop
+# reads weights on every item and every evidence registration, and a direct
+# key lookup beats the chained dict-of-dict access it replaces.
+ITEM_WEIGHT: Dict[str, int] = {
+    key: meta["weight"] for key, meta in TRACEABILITY_ITEMS.items()
+}
+
+# One multi-pattern scanner over every keyword of every item, built once at
+# import. Scanning a file's content with this single alternation and routing
+# hits back through the closure table replaces a per-item, per-keyword
+# substring loop (and its per-keyword re-lowercasing of the whole content).
+# The lookahead keeps matches overlapping, but the alternation still
+# captures only one (the longest) keyword per position: a shorter keyword
+# starting at the same position is shadowed — e.g. "monitoring" would hide
+# "monitor". Any keyword shadowed that way is necessarily a substring of
+# the captured one, so each keyword's item set is precomputed as the union
+# over all keywords contained in it; crediting that closure per capture
+# restores exact plain-substring semantics.
+_kw_to_items: Dict[str, List[str]] = {}
+for _key, _meta in TRACEABILITY_ITEMS.items():
+    for _kw in _meta.get("keywords", []):
+        _kw_to_items.setdefault(_kw.casefold(), []).append(_key)
+_KEYWORD_CLOSURE_ITEMS: Dict[str, frozenset] = {
+    kw: frozenset(
+        key
+        for other, keys in _kw_to_items.items() if other in kw
+        for key in keys
+    )
+    for kw in _kw_to_items
+}
+del _kw_to_items
+_KEYWORD_SCAN_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_KEYWORD_CLOSURE_ITEMS, key=len, reverse=True))) + "))"
+)
+
+def _keyword_items(text_low: str) -> Set[str]:
+    """Item keys whose keywords occur in already-casefolded text."""
+    items: Set[str] = set()
+    for kw in set(_KEYWORD_SCAN_RE.findall(text_low)):
+        items.update(_KEYWORD_CLOSURE_ITEMS[kw])
+    return items
+
+# Scoring is binary per item (full weight once any evidence is found), so
+# registering every matching file only grows the evidence list. Ten entries
+# are plenty for an auditor to follow up on; past that the match loop stops
+# copying evidence for the item.
+MAX_EVIDENCE_PER_ITEM = 10
+
+def _new_item_detail(item_key: str, risk_level: str) -> Dict[str, Any]:
+    """Fresh details entry for one traceability item. Centralises the shape
+    that perform_audit and its evidence hook previously rebuilt as three
+    diverging dict literals."""
+    meta = TRACEABILITY_ITEMS.get(item_key, {})
+    return {
+        "weight": ITEM_WEIGHT.get(item_key, 0),
+        "score": 0,
+        "checks": [],
+        "evidence": [],
+        "status": "not_found",
+        "is_required_for_risk": risk_level in meta.get("required_for", ()),
+        "legal_basis": meta.get("legal_basis", {}),
+    }
+
 # --- SCHEMAS (minimal) for metadata validation ---
 MINIMAL_METADATA_SCHEMA = {
     "type": "object",
@@ -421,6 +528,28 @@ FILE_PATTERNS = {
     "other_text": [".json", ".yaml", ".yml", ".csv", ".txt", ".md"]
 }
 
+# Precompiled matchers derived from FILE_PATTERNS, built once at import:
+# per category, a frozenset of exact suffixes and a single alternation regex
+# over the substring patterns. Classification becomes one set lookup plus at
+# most one C-level regex search per category instead of a Python `in` loop
+# over every pattern. Category order is preserved — first match wins, exactly
+# as in the original nested loop.
+_CATEGORY_MATCHERS: List[Tuple[str, frozenset, Optional[re.Pattern]]] = []
+for _category, _patterns in FILE_PATTERNS.items():
+    _suffixes = frozenset(p for p in _patterns if p.startswith('.'))
+    _substrings = [p for p in _patterns if not p.startswith('.')]
+    _regex = re.compile('|'.join(map(re.escape, _substrings))) if _substrings else None
+    _CATEGORY_MATCHERS.append((_category, _suffixes, _regex))
+
+# decision_logs' name alternation, kept separately: suffix priority files
+# every .csv under dataset_files before the log name patterns are consulted,
+# so the audit re-checks dataset CSVs against this pattern to route
+# log-named ones into log parsing as well.
+_LOG_NAME_RE = next(
+    regex for category, _sufs, regex in _CATEGORY_MATCHERS
+    if category == "decision_logs"
+)
+
 # Directories to ignore during scan
 IGNORED_DIRS = {
     ".git", "__pycache__", ".pytest_cache", "node_modules", ".mypy_cache",
@@ -434,57 +563,252 @@ try:
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
+# pyarrow's SIMD CSV reader ingests large datasets columnar-first; the
+# audit needs column names, row counts and the distinct model_version
+# values, never per-row dicts
+try:
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# orjson decodes JSON with SIMD UTF-8 validation and C-level object
+# construction; stdlib json remains the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _dumps_report(report: Dict[str, Any]) -> bytes:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    _json_loads = json.loads
+
+    def _dumps_report(report: Dict[str, Any]) -> bytes:
+        return json.dumps(report, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+# BLAKE3 hashes large artifacts several times faster than SHA-256 (SIMD +
+# multithreaded tree mode). It is only used for integrity comparison when
+# the audited metadata itself carries a blake3_hash field; every legally
+# citable digest in reports and evidence stays SHA-256.
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# fastjsonschema compiles a schema into a specialized validator function once
+# at import, instead of re-walking the schema tree on every validate call
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+    _COMPILED_VALIDATORS = {
+        id(schema): fastjsonschema.compile(schema)
+        for schema in (MINIMAL_METADATA_SCHEMA, MINIMAL_LOG_SCHEMA)
+    }
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    _COMPILED_VALIDATORS = {}
+
+# Required-field tuples precomputed for the dependency-free fallback branch
+# (tuple, not set: issue order must stay deterministic)
+_SCHEMA_REQUIRED = {
+    id(schema): tuple(schema.get("required", []))
+    for schema in (MINIMAL_METADATA_SCHEMA, MINIMAL_LOG_SCHEMA)
+}
+
 def sha256_of_bytes(data: bytes) -> str:
     h = hashlib.sha256()
     h.update(data)
     return h.hexdigest()
 
 def sha256_of_file(path: Path) -> str:
-    sha256 = hashlib.sha256()
     try:
         if not path.is_file():
             return "error: not a file"
         with path.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
+            if hasattr(os, "posix_fadvise"):
+                # Tell the kernel the whole file will be read sequentially so
+                # readahead is aggressive and pages are dropped after use
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            # Large artifacts (model weights, datasets): map the whole file
+            # and hand it to the digest in one C call — no read loop, no
+            # buffer copies. Small files stay on the streaming paths below,
+            # where mmap setup would cost more than it saves.
+            if os.fstat(f.fileno()).st_size >= (8 << 20):
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        sha256 = hashlib.sha256()
+                        sha256.update(mm)
+                        return sha256.hexdigest()
+                except (ValueError, OSError):
+                    pass
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: streams straight into OpenSSL's SHA-NI
+                # accelerated digest with the GIL released.
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            # Fallback: 1 MiB reads into a preallocated buffer instead of
+            # 4 KiB chunks — far fewer syscalls and no per-chunk bytes objects.
+            sha256 = hashlib.sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while (n := f.readinto(buf)):
+                sha256.update(view[:n])
         return sha256.hexdigest()
     except Exception as e:
         return f"error: {str(e)}"
 
+# Hashes memoized by (path, mtime_ns, size): any rewrite invalidates the
+# entry, and repeated consumers (integrity checks, evidence copies) reuse
+# the digest instead of re-reading the file.
+_HASH_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+# Sidecar name for persisting the hash cache between audit runs. Keys are
+# "path|mtime_ns|size", so a file that changed on disk simply misses and is
+# rehashed; stale entries are dropped on save.
+_HASH_CACHE_FILENAME = ".hash_cache.json"
+
+def load_hash_cache(evidence_dir: Path) -> None:
+    """Seed _HASH_CACHE from the sidecar of a previous run, if present."""
+    cache_path = evidence_dir / _HASH_CACHE_FILENAME
+    try:
+        stored = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return
+    if not isinstance(stored, dict):
+        return
+    for key, digest in stored.items():
+        try:
+            path_str, mtime_ns, size = key.rsplit("|", 2)
+            _HASH_CACHE.setdefault((path_str, int(mtime_ns), int(size)), digest)
+        except (ValueError, AttributeError):
+            continue
+
+def save_hash_cache(evidence_dir: Path) -> None:
+    """Flush _HASH_CACHE to the sidecar, pruning entries whose file no
+    longer matches the recorded (mtime, size)."""
+    live = {}
+    for (path_str, mtime_ns, size), digest in _HASH_CACHE.items():
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            continue
+        if st.st_mtime_ns == mtime_ns and st.st_size == size:
+            live[f"{path_str}|{mtime_ns}|{size}"] = digest
+    try:
+        cache_path = evidence_dir / _HASH_CACHE_FILENAME
+        cache_path.write_text(json.dumps(live), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not persist hash cache: {e}")
+
+def hash_file_cached(path: Path) -> str:
+    try:
+        st = _stat_cached(path)
+    except OSError:
+        return sha256_of_file(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _HASH_CACHE.get(key)
+    if cached is None:
+        cached = _HASH_CACHE[key] = sha256_of_file(path)
+    return cached
+
+_BLAKE3_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+def blake3_file_cached(path: Path) -> str:
+    """BLAKE3 digest of a file, memoized like hash_file_cached. Only called
+    when the blake3 module is importable; uses its memory-mapped,
+    multithreaded hasher."""
+    try:
+        st = _stat_cached(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _BLAKE3_CACHE.get(key)
+        if cached is None:
+            h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            h.update_mmap(str(path))
+            cached = _BLAKE3_CACHE[key] = h.hexdigest()
+        return cached
+    except Exception as e:
+        return f"error: {str(e)}"
+
 def safe_read_text(path: Path, max_bytes: int = 8192) -> Tuple[Optional[str], Optional[str]]:
     try:
         if not path.is_file():
             return None, "not a file"
         with path.open("rb") as f:
             raw_data = f.read(max_bytes)
-        for encoding in ["utf-8", "latin-1", "cp1252", "ascii"]:
-            try:
-                decoded = raw_data.decode(encoding)
-                return decoded, None
-            except UnicodeDecodeError:
-                continue
-        return None, "Unable to decode with common encodings"
+        # One strict UTF-8 attempt (with BOM peel), then latin-1, which maps
+        # every byte and therefore cannot fail — no decode cascade. ascii is
+        # a UTF-8 subset and cp1252 only differed for pattern-irrelevant
+        # punctuation, so the old four-attempt loop added nothing but retries.
+        if raw_data.startswith(b"\xef\xbb\xbf"):
+            raw_data = raw_data[3:]
+        try:
+            return raw_data.decode("utf-8"), None
+        except UnicodeDecodeError:
+            return raw_data.decode("latin-1"), None
     except Exception as e:
         return None, f"Exception during read: {str(e)}"
 
 def load_file(path: Path) -> Any:
+    """Parse a file by suffix, memoized on (path, mtime_ns, size) so the
+    same artifact is decoded once per audit even when several checks
+    re-read it. The stat key makes invalidation automatic on change."""
     if not path.is_file():
         return None
+    try:
+        st = _stat_cached(path)
+    except OSError:
+        return None
+    return _load_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=4096)
+def _load_file_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    path = Path(path_str)
     try:
         suffix = path.suffix.lower()
         if suffix == ".json":
-            return json.loads(path.read_text(encoding="utf-8"))
+            # read_bytes + orjson skips the str round-trip of read_text
+            return _json_loads(path.read_bytes())
         elif suffix in (".yaml", ".yml"):
             try:
                 import yaml
-                return yaml.safe_load(path.read_text(encoding="utf-8"))
+                # libyaml's C loader parses several times faster when the
+                # wheel ships with it; same safe-loading semantics
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                return yaml.load(path.read_text(encoding="utf-8"), Loader=loader)
             except ImportError:
                 logger.warning("PyYAML not installed. Skipping YAML parsing.")
                 return path.read_text(encoding="utf-8")
         elif suffix == ".csv":
+            # The audit inspects column names and row counts for evidence —
+            # a columnar summary avoids building one dict per row on
+            # multi-GB datasets. The one per-row consumer is the
+            # cross-reference check, which needs the distinct model_version
+            # values, so that single column is carried in the summary.
+            if PYARROW_AVAILABLE:
+                table = pacsv.read_csv(
+                    path, read_options=pacsv.ReadOptions(block_size=1 << 20))
+                summary = {"columns": table.column_names, "num_rows": table.num_rows}
+                if "model_version" in table.column_names:
+                    summary["model_versions"] = sorted(
+                        {str(v) for v in table.column("model_version").to_pylist()
+                         if v is not None})
+                return summary
             import csv
             with path.open("r", encoding="utf-8", errors='ignore') as f:
-                return list(csv.DictReader(f))
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if "model_version" in header:
+                    mv_idx = header.index("model_version")
+                    versions = set()
+                    num_rows = 0
+                    for row in reader:
+                        num_rows += 1
+                        if len(row) > mv_idx:
+                            versions.add(row[mv_idx])
+                    return {"columns": header, "num_rows": num_rows,
+                            "model_versions": sorted(versions)}
+                num_rows = sum(1 for _ in reader)
+            return {"columns": header, "num_rows": num_rows}
         else:
             return path.read_text(encoding="utf-8", errors='ignore')
     except Exception as e:
@@ -492,10 +816,22 @@ def load_file(path: Path) -> Any:
         return f"error_reading_file: {str(e)}"
 
 def validate_with_schema(obj: Any, schema: Dict) -> List[str]:
+    compiled = _COMPILED_VALIDATORS.get(id(schema))
+    if compiled is not None:
+        try:
+            compiled(obj)
+            return []
+        except fastjsonschema.JsonSchemaException as e:
+            return [e.message]
+        except Exception as e:
+            return [f"Schema validation failed: {str(e)}"]
     if not JSONSCHEMA_AVAILABLE:
         issues = []
-        if isinstance(schema, dict) and "required" in schema and isinstance(obj, dict):
-            for r in schema.get("required", []):
+        if isinstance(obj, dict) and isinstance(schema, dict):
+            required = _SCHEMA_REQUIRED.get(id(schema))
+            if required is None:
+                required = schema.get("required", [])
+            for r in required:
                 if r not in obj:
                     issues.append(f"missing required field: {r}")
         return issues
@@ -516,81 +852,187 @@ def parse_timestamp(value: str) -> Optional[datetime]:
     except ValueError:
         return None
 
+def parse_timestamps(values: List[str]) -> List[Optional[datetime]]:
+    """Batch companion to parse_timestamp for whole decision logs: one
+    tight comprehension over the C-level fromisoformat instead of a
+    Python call per entry at each call site."""
+    _parse = parse_timestamp
+    return [_parse(v) for v in values]
+
 # --- SCANNER LOGIC ---
-def should_ignore_dir(dir_path: Path, root: Path) -> bool:
-    try:
-        rel_path = dir_path.relative_to(root)
-        parts = rel_path.parts
-        return any(part in IGNORED_DIRS for part in parts)
-    except Exception:
-        return True
+def iter_repository_files(root_path: Union[str, Path]):
+    """Yield os.DirEntry objects for every regular file under root_path,
+    pruning IGNORED_DIRS at descent time so ignored subtrees are never
+    entered. DirEntry carries the readdir d_type and caches stat(), so
+    classification and retention checks cost no extra syscalls.
+
+    Pruning here also means no per-file ancestor checks exist anywhere:
+    every yielded entry is reachable only through non-ignored directories,
+    so callers never need to re-test (or memoize) parent paths."""
+    stack = [str(root_path)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_name(name: str) -> Optional[str]:
+    """Map a file name to its first matching category. Memoized on the raw
+    name: repeated names (config.yaml, metadata.json, ...) across a tree
+    resolve to a dict hit without even re-lowercasing, the dominant
+    per-file allocation in the scan loop."""
+    file_name = name.lower()
+    file_suffix = os.path.splitext(file_name)[1]
+    for category, suffixes, regex in _CATEGORY_MATCHERS:
+        if file_suffix in suffixes or (regex is not None and regex.search(file_name)):
+            return category
+    return None
+
+# Stat results captured from the walker's cached DirEntry data, keyed by
+# path string: downstream consumers (hashing, parsing) stat the same files
+# again right after the scan, and this column of the scan result lets them
+# reuse the readdir-time data instead of re-entering the kernel.
+_STAT_CACHE: Dict[str, os.stat_result] = {}
+
+# Per-category path strings, another scan-time column: the walker already
+# holds each path as the string entry.path, so keeping it spares consumers
+# that scan textual paths (e.g. the .dvc check) a str(Path) round-trip per
+# file. Rebuilt on every scan alongside _STAT_CACHE.
+_SCAN_STRS: Dict[str, List[str]] = {}
+
+def _stat_cached(path: Path) -> os.stat_result:
+    st = _STAT_CACHE.get(str(path))
+    return st if st is not None else path.stat()
 
 def scan_repository(root_path: Path) -> Dict[str, List[Path]]:
     candidates: Dict[str, List[Path]] = {key: [] for key in FILE_PATTERNS.keys()}
     if not root_path.exists() or not root_path.is_dir():
         logger.warning(f"Repository path {root_path} does not exist or is not a directory.")
         return candidates
+    _STAT_CACHE.clear()
+    _SCAN_STRS.clear()
+    _SCAN_STRS.update({key: [] for key in FILE_PATTERNS.keys()})
     try:
-        for file_path in root_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if any(should_ignore_dir(parent, root_path) for parent in file_path.parents):
-                continue
-            file_name = file_path.name.lower()
-            file_suffix = file_path.suffix.lower()
-            for category, patterns in FILE_PATTERNS.items():
-                matched = False
-                for pattern in patterns:
-                    if (pattern.startswith('.') and file_suffix == pattern) or \
-                       (not pattern.startswith('.') and pattern in file_name):
-                        candidates[category].append(file_path)
-                        matched = True
-                        break
-                if matched:
-                    break
+        for entry in iter_repository_files(root_path):
+            category = _classify_name(entry.name)
+            if category is not None:
+                candidates[category].append(Path(entry.path))
+                _SCAN_STRS[category].append(entry.path)
+                try:
+                    _STAT_CACHE[entry.path] = entry.stat()
+                except OSError:
+                    pass
     except Exception as e:
         logger.error(f"Error during repository scan: {e}")
     return candidates
 
 # --- AUDIT LOGIC ---
+# Evidence blobs already copied in this run, keyed by (evidence dir, content
+# hash): identical sources become hardlinks to one blob instead of new copies.
+_EVIDENCE_BY_HASH: Dict[Tuple[str, str], str] = {}
+
+def _copy_file_contents(src_path: Path, dest_path: Path, size: int) -> None:
+    """Copy file contents kernel-side when possible: copy_file_range stays
+    in-kernel (and can reflink on XFS/Btrfs), sendfile avoids the userspace
+    bounce buffer; shutil.copyfile is the portable fallback."""
+    with src_path.open("rb") as s, dest_path.open("wb") as d:
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = size
+                while remaining > 0:
+                    n = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                return
+            except OSError:
+                s.seek(0)
+                d.seek(0)
+                d.truncate()
+        if hasattr(os, "sendfile"):
+            try:
+                remaining = size
+                while remaining > 0:
+                    n = os.sendfile(d.fileno(), s.fileno(), None, remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                return
+            except OSError:
+                s.seek(0)
+                d.seek(0)
+                d.truncate()
+    shutil.copyfile(src_path, dest_path)
+
 def copy_evidence(src_path: Path, evidence_dir: Path) -> str:
     try:
         if not src_path.is_file():
             return "error: source not a file"
         try:
-            mtime = src_path.stat().st_mtime
+            st = src_path.stat()
+            mtime = st.st_mtime
+            size = st.st_size
         except Exception:
             mtime = 0
-        file_hash = sha256_of_file(src_path)
+            size = 0
+        # The dedup key and the destination-name prefix deliberately reuse the
+        # SHA-256 digest: the evidence index must carry SHA-256 for legal
+        # immutability regardless, and hash_file_cached has already paid for
+        # it, so a faster internal hash (e.g. BLAKE3) would mean a second full
+        # read of every file rather than a saving.
+        file_hash = hash_file_cached(src_path)
         if file_hash.startswith("error"):
             file_hash = "unknown"
         dest_name = f"{int(mtime)}_{file_hash[:16]}__{src_path.name}"
         dest_path = evidence_dir / dest_name
         counter = 1
-        original_dest_path = dest_path
         while dest_path.exists():
             dest_name = f"{int(mtime)}_{file_hash[:16]}__{counter}__{src_path.name}"
             dest_path = evidence_dir / dest_name
             counter += 1
-        shutil.copy2(src_path, dest_path)
+        dedup_key = (str(evidence_dir), file_hash)
+        existing = _EVIDENCE_BY_HASH.get(dedup_key) if file_hash != "unknown" else None
+        if existing is not None and os.path.exists(existing):
+            try:
+                os.link(existing, dest_path)
+            except OSError:
+                _copy_file_contents(src_path, dest_path, size)
+        else:
+            _copy_file_contents(src_path, dest_path, size)
+            if file_hash != "unknown":
+                _EVIDENCE_BY_HASH[dedup_key] = str(dest_path)
+        # Preserve source metadata explicitly (shutil.copy2 semantics)
+        shutil.copystat(src_path, dest_path, follow_symlinks=False)
         return str(dest_path.relative_to(evidence_dir.parent))
     except Exception as e:
         return f"error: {str(e)}"
 
-def validate_retention_policies(file_paths: List[Path]) -> List[str]:
+# Retention-sensitive file names, matched with one C-level regex search
+# instead of four Python substring probes per file
+RETENTION_NAME_RE = re.compile(r"log|audit|backup|trace")
+
+def validate_retention_policies(entries) -> List[str]:
+    """Flag retention-sensitive files older than one year. `entries` is the
+    DirEntry stream from iter_repository_files: the cutoff is one float
+    computed up front and compared to st_ctime directly, with no datetime
+    object built per file."""
     issues = []
-    retention_period = datetime.now() - timedelta(days=365)
-    for path in file_paths:
-        try:
-            if any(term in path.name.lower() for term in ["log", "audit", "backup", "trace"]):
-                try:
-                    creation_time = datetime.fromtimestamp(path.stat().st_ctime)
-                    if creation_time < retention_period:
-                        issues.append(f"Arquivo antigo potencialmente fora da política de retenção: {path}")
-                except Exception:
-                    issues.append(f"Não foi possível verificar a idade do arquivo: {path}")
-        except Exception:
-            continue
+    cutoff_ts = (datetime.now() - timedelta(days=365)).timestamp()
+    for entry in entries:
+        if RETENTION_NAME_RE.search(entry.name.lower()):
+            try:
+                if entry.stat().st_ctime < cutoff_ts:
+                    issues.append(f"Arquivo antigo potencialmente fora da política de retenção: {entry.path}")
+            except OSError:
+                issues.append(f"Não foi possível verificar a idade do arquivo: {entry.path}")
     return issues
 
 def check_cross_references(
@@ -598,37 +1040,42 @@ def check_cross_references(
     log_files: List[Tuple[Path, Any]]
 ) -> List[str]:
     issues = []
-    model_versions = set()
-    for path, metadata in metadata_files:
-        try:
-            if isinstance(metadata, dict) and "version" in metadata:
-                model_versions.add(str(metadata["version"]))
-        except Exception:
-            continue
+    model_versions = frozenset(
+        str(metadata["version"])
+        for _, metadata in metadata_files
+        if isinstance(metadata, dict) and "version" in metadata
+    )
     for path, log_data in log_files:
         try:
-            if isinstance(log_data, dict) and "model_version" in log_data:
-                log_version = str(log_data["model_version"])
-                if log_version not in model_versions:
-                    issues.append(f"Log {path.name} referencia versão de modelo desconhecida: {log_version}")
-            elif isinstance(log_data, list):
-                for entry in log_data:
-                    if isinstance(entry, dict) and "model_version" in entry:
-                        log_version = str(entry["model_version"])
-                        if log_version not in model_versions:
-                            issues.append(f"Log {path.name} referencia versão de modelo desconhecida: {log_version}")
-                            break
+            entries = log_data if isinstance(log_data, (list, tuple)) else [log_data]
+            log_versions = set()
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                if "model_version" in entry:
+                    log_versions.add(str(entry["model_version"]))
+                # CSV logs arrive as a columnar summary that carries the
+                # distinct model_version column values instead of per-row
+                # dicts
+                for version in entry.get("model_versions", ()):
+                    log_versions.add(str(version))
+            # Hashed set difference in C instead of a membership probe per
+            # entry; reports every distinct unknown version (the old loop
+            # stopped at the first unknown inside list logs)
+            for log_version in sorted(log_versions - model_versions):
+                issues.append(f"Log {path.name} referencia versão de modelo desconhecida: {log_version}")
         except Exception:
             continue
     return issues
 
 def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[str, Any]:
+    load_hash_cache(evidence_dir)
     candidates = scan_repository(repo_root)
-    required_items = RISK_LEVELS.get(risk_level, [])
+    required_items = RISK_REQUIRED.get(risk_level, frozenset())
     audit_results: Dict[str, Any] = {
         "summary": {
             "total_score": 0,
-            "max_score": sum(TRACEABILITY_ITEMS[item]["weight"] for item in required_items),
+            "max_score": RISK_MAX_SCORE.get(risk_level, 0),
             "scanned_files": sum(len(files) for files in candidates.values()),
             "risk_level": risk_level,
             "required_items_count": len(required_items)
@@ -640,21 +1087,33 @@ def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[
         "scanned_categories": {k: len(v) for k, v in candidates.items()}
     }
 
-    parsed_metadata = []
-    parsed_logs = []
-    for p in candidates.get("metadata_files", []):
-        try:
-            parsed_metadata.append((p, load_file(p)))
-        except Exception:
-            parsed_metadata.append((p, None))
-    for p in candidates.get("decision_logs", []):
+    # Parsing and hashing are independent per file and I/O-bound (the JSON
+    # decode and OpenSSL digest both release the GIL around reads), so fan
+    # them out over a thread pool; map() preserves submission order.
+    def _load_safe(p: Path) -> Any:
         try:
-            parsed_logs.append((p, load_file(p)))
+            return load_file(p)
         except Exception:
-            parsed_logs.append((p, None))
+            return None
+
+    metadata_paths = candidates.get("metadata_files", [])
+    # Log-named CSVs (decision_log.csv, predictions.csv, ...) classify as
+    # dataset_files by suffix priority; route them into log parsing too so
+    # the cross-reference check sees their model_version column.
+    log_paths = candidates.get("decision_logs", []) + [
+        p for p in candidates.get("dataset_files", [])
+        if p.suffix.lower() == ".csv" and _LOG_NAME_RE.search(p.name.lower())
+    ]
+    hash_paths = candidates.get("dataset_files", []) + candidates.get("model_artifacts", [])
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+        parsed_metadata = list(zip(metadata_paths, executor.map(_load_safe, metadata_paths)))
+        parsed_logs = list(zip(log_paths, executor.map(_load_safe, log_paths)))
+        # Pre-warm the hash cache for every later integrity/evidence consumer
+        list(executor.map(hash_file_cached, hash_paths))
 
     try:
-        audit_results["retention_issues"] = validate_retention_policies(list(repo_root.rglob("*")))
+        audit_results["retention_issues"] = validate_retention_policies(
+            iter_repository_files(repo_root))
     except Exception as e:
         logger.error(f"Error validating retention policies: {e}")
         audit_results["retention_issues"] = [f"Error during retention validation: {e}"]
@@ -665,84 +1124,97 @@ def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[
         logger.error(f"Error checking cross references: {e}")
         audit_results["cross_reference_issues"] = [f"Error during cross-reference validation: {e}"]
 
+    # Hashed shadow of each item's evidence list: the list itself stays in
+    # the report (order preserved), the set answers the duplicate check in
+    # O(1) instead of rescanning the list per registration.
+    evidence_seen: Dict[str, Set[str]] = {}
+
     def register_item_evidence(item_key: str, file_path: Path):
         try:
             if not file_path.is_file():
                 return
             rel_path = str(file_path.relative_to(repo_root))
             if item_key not in audit_results["details"]:
-                item_meta = TRACEABILITY_ITEMS.get(item_key, {})
-                audit_results["details"][item_key] = {
-                    "weight": item_meta.get("weight", 0),
-                    "score": 0,
-                    "checks": [],
-                    "evidence": [],
-                    "status": "not_found",
-                    "is_required_for_risk": risk_level in item_meta.get("required_for", []),
-                    "legal_basis": item_meta.get("legal_basis", {})
-                }
+                audit_results["details"][item_key] = _new_item_detail(item_key, risk_level)
             if rel_path not in audit_results["evidence_index"]:
                 copied_path = copy_evidence(file_path, evidence_dir)
                 if copied_path and not copied_path.startswith("error"):
                     audit_results["evidence_index"][rel_path] = copied_path
-            if rel_path not in audit_results["details"][item_key]["evidence"]:
+            seen = evidence_seen.setdefault(item_key, set())
+            if rel_path not in seen:
+                seen.add(rel_path)
                 audit_results["details"][item_key]["evidence"].append(rel_path)
         except Exception as e:
             logger.debug(f"Error registering evidence for {item_key} from {file_path}: {e}")
 
-    for item_key, item_meta in TRACEABILITY_ITEMS.items():
+    # Read, casefold and keyword-scan every candidate file exactly once,
+    # recording which items each file evidences. The item loop below then
+    # consults this index instead of re-reading every file per item (22
+    # reads and 22 full-content lowercasings per file in the old shape).
+    # Metadata hash columns indexed into sets once: the integrity branches
+    # probe them per artifact, and hashed membership replaces an O(M) scan
+    # of parsed_metadata per file.
+    dataset_hash_set = {m["dataset_hash"] for _, m in parsed_metadata
+                        if isinstance(m, dict) and "dataset_hash" in m}
+    model_hash_set = {m["model_hash"] for _, m in parsed_metadata
+                      if isinstance(m, dict) and "model_hash" in m}
+    b3_hash_set = {m["blake3_hash"] for _, m in parsed_metadata
+                   if isinstance(m, dict) and "blake3_hash" in m}
+
+    file_item_matches: List[Tuple[Path, Set[str]]] = []
+    for category, files in candidates.items():
+        for file_path in files:
+            try:
+                content, error = safe_read_text(file_path, max_bytes=8192)
+                if content is None:
+                    continue
+                matched = _keyword_items(content.casefold())
+                matched |= _keyword_items(file_path.name.casefold())
+                if matched:
+                    file_item_matches.append((file_path, matched))
+            except Exception:
+                continue
+
+    for item_key in RISK_ITEM_ORDER.get(risk_level, ()):
+        item_meta = TRACEABILITY_ITEMS[item_key]
         try:
-            if item_key not in audit_results["details"]:
-                item_result = {
-                    "weight": item_meta["weight"],
-                    "score": 0,
-                    "checks": [],
-                    "evidence": [],
-                    "status": "not_found",
-                    "is_required_for_risk": risk_level in item_meta.get("required_for", []),
-                    "legal_basis": item_meta.get("legal_basis", {})
-                }
+            # Entries are only ever created by _new_item_detail (here or in
+            # the evidence hook), so an existing entry is already complete —
+            # no per-field repair pass needed. Every item in this loop is
+            # required for the risk level by construction of
+            # RISK_ITEM_ORDER, so no per-item required check remains.
+            item_result = audit_results["details"].get(item_key)
+            if item_result is None:
+                item_result = _new_item_detail(item_key, risk_level)
                 audit_results["details"][item_key] = item_result
-            else:
-                item_result = audit_results["details"][item_key]
-                item_result.setdefault("weight", item_meta["weight"])
-                item_result.setdefault("score", 0)
-                item_result.setdefault("checks", [])
-                item_result.setdefault("evidence", [])
-                item_result.setdefault("status", "not_found")
-                item_result.setdefault("is_required_for_risk", risk_level in item_meta.get("required_for", []))
-                item_result.setdefault("legal_basis", item_meta.get("legal_basis", {}))
-
-            if not item_result["is_required_for_risk"]:
-                item_result["status"] = "optional"
-                continue
 
             found_evidence = False
-            for category, files in candidates.items():
-                for file_path in files:
-                    try:
-                        content, error = safe_read_text(file_path, max_bytes=8192)
-                        if content is None:
-                            continue
-                        if any(kw.lower() in content.lower() or kw.lower() in file_path.name.lower() for kw in item_meta.get("keywords", [])):
-                            item_result["checks"].append(f"Keyword match for '{item_meta['en_name']}' in {file_path.name}.")
-                            register_item_evidence(item_key, file_path)
-                            found_evidence = True
-                    except Exception as e:
-                        continue
+            en_name = item_meta["en_name"]
+            checks = item_result["checks"]
+            keyword_matches = 0
+            for file_path, matched_items in file_item_matches:
+                if item_key in matched_items:
+                    checks.append(f"Keyword match for '{en_name}' in {file_path.name}.")
+                    register_item_evidence(item_key, file_path)
+                    found_evidence = True
+                    keyword_matches += 1
+                    if keyword_matches >= MAX_EVIDENCE_PER_ITEM:
+                        break
 
             try:
                 if item_key == "dataset_versioning":
-                    dataset_hashes = []
-                    for _, metadata in parsed_metadata:
-                        if isinstance(metadata, dict) and "dataset_hash" in metadata:
-                            dataset_hashes.append(metadata["dataset_hash"])
-                    if dataset_hashes or any(".dvc" in str(p) for p in candidates.get("other_text", [])):
+                    if dataset_hash_set or b3_hash_set or any(".dvc" in s for s in _SCAN_STRS.get("other_text", ())):
                         item_result["checks"].append("Specific dataset versioning artifacts found (DVC or dataset_hash).")
                         found_evidence = True
                         for path in candidates.get("dataset_files", []):
-                            actual_hash = sha256_of_file(path)
-                            if actual_hash in dataset_hashes:
+                            # Prefer the BLAKE3 comparison when the metadata
+                            # supplies one and the module is present; SHA-256
+                            # remains the comparison of record otherwise.
+                            matched = (BLAKE3_AVAILABLE and b3_hash_set
+                                       and blake3_file_cached(path) in b3_hash_set)
+                            if not matched and dataset_hash_set:
+                                matched = hash_file_cached(path) in dataset_hash_set
+                            if matched:
                                 item_result["checks"].append(f"Dataset hash validated for {path.name}.")
                                 register_item_evidence(item_key, path)
                 elif item_key == "model_versioning":
@@ -771,10 +1243,13 @@ def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[
                         for path, _ in parsed_logs + parsed_metadata:
                             register_item_evidence(item_key, path)
                 elif item_key == "file_integrity_hash":
+                    use_b3 = BLAKE3_AVAILABLE and bool(b3_hash_set)
                     for path in candidates.get("dataset_files", []) + candidates.get("model_artifacts", []):
-                        actual_hash = sha256_of_file(path)
-                        if any(isinstance(m, dict) and m.get("dataset_hash") == actual_hash for _, m in parsed_metadata) or \
-                           any(isinstance(m, dict) and m.get("model_hash") == actual_hash for _, m in parsed_metadata):
+                        matched = use_b3 and blake3_file_cached(path) in b3_hash_set
+                        if not matched:
+                            actual_hash = hash_file_cached(path)
+                            matched = actual_hash in dataset_hash_set or actual_hash in model_hash_set
+                        if matched:
                             item_result["checks"].append(f"File integrity confirmed for {path.name}.")
                             found_evidence = True
                             register_item_evidence(item_key, path)
@@ -783,7 +1258,7 @@ def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[
                 item_result["checks"].append(f"Error during specific validation: {e}")
 
             if found_evidence:
-                item_result["score"] = item_meta["weight"]
+                item_result["score"] = ITEM_WEIGHT[item_key]
                 item_result["status"] = "found"
             else:
                 item_result["checks"].append(f"No clear evidence found for '{item_meta['en_name']}'.")
@@ -793,16 +1268,23 @@ def perform_audit(repo_root: Path, evidence_dir: Path, risk_level: str) -> Dict[
         except Exception as e:
             logger.error(f"Unexpected error processing item {item_key}: {e}")
             if item_key not in audit_results["details"]:
-                audit_results["details"][item_key] = {
-                    "weight": item_meta.get("weight", 0),
-                    "score": 0,
-                    "checks": [f"Critical error during audit: {e}"],
-                    "evidence": [],
-                    "status": "error",
-                    "is_required_for_risk": risk_level in item_meta.get("required_for", []),
-                    "legal_basis": item_meta.get("legal_basis", {})
-                }
+                detail = _new_item_detail(item_key, risk_level)
+                detail["checks"] = [f"Critical error during audit: {e}"]
+                detail["status"] = "error"
+                audit_results["details"][item_key] = detail
 
+    # Non-required items only need a status entry; they skip the evidence
+    # path entirely.
+    for item_key in TRACEABILITY_ITEMS:
+        if item_key in required_items:
+            continue
+        detail = audit_results["details"].get(item_key)
+        if detail is None:
+            detail = _new_item_detail(item_key, risk_level)
+            audit_results["details"][item_key] = detail
+        detail["status"] = "optional"
+
+    save_hash_cache(evidence_dir)
     return audit_results
 
 # --- MAIN EXECUTION LOGIC ---
@@ -831,99 +1313,95 @@ def generate_multilingual_report(audit_results: Dict[str, Any], repo_path: Path,
     max_score = report["summary"]["max_score"]
     report["summary"]["compliance_percentage"] = round((total_score / max_score) * 100, 2) if max_score > 0 else 0.0
 
+    # Only the item name differs between languages; the old per-language
+    # blocks serialized the full result and legal basis three times each,
+    # tripling the details section on disk and in the integrity hash.
     for k, v in audit_results["details"].items():
         item_meta = TRACEABILITY_ITEMS.get(k, {})
-        legal_basis_used = item_meta.get("legal_basis", {})
         report["details"][k] = {
-            "en": {
-                "name": item_meta.get("en_name", k),
-                "description": item_meta.get("desc", ""),
-                "result": v,
-                "legal_basis": legal_basis_used
-            },
-            "pt": {
-                "name": item_meta.get("pt_name", k),
-                "description": item_meta.get("desc", ""),
-                "result": v,
-                "legal_basis": legal_basis_used
-            },
-            "es": {
-                "name": item_meta.get("es_name", k),
-                "description": item_meta.get("desc", ""),
-                "result": v,
-                "legal_basis": legal_basis_used
+            "name": {
+                "en": item_meta.get("en_name", k),
+                "pt": item_meta.get("pt_name", k),
+                "es": item_meta.get("es_name", k),
             },
+            "description": item_meta.get("desc", ""),
+            "result": v,
+            "legal_basis": item_meta.get("legal_basis", {}),
         }
 
     return report
 
-def get_console_messages(lang: str = "pt") -> Dict[str, str]:
-    messages = {
-        "pt": {
-            "start": "🚀 Iniciando auditoria de rastreabilidade de IA (nível de risco: {risk_level})...",
-            "repo": "📁 Auditando repositório:",
-            "scan": "🔍 Escaneando repositório e analisando artefatos...",
-            "report": "📊 Gerando relatório multilíngue com base legal...",
-            "save": "💾 Relatório salvo em:",
-            "hash": "🔒 Hash de integridade:",
-            "done": "🎯 Auditoria concluída com sucesso!",
-            "summary_title": "📋 RESUMO DA AUDITORIA DE RASTREABILIDADE",
-            "compliance": "✅ Conformidade com nível {risk_level} (base legal: EU AI Act, NIST, ISO)",
-            "score": "📊 Pontuação",
-            "files": "📁 Arquivos escaneados",
-            "retention": "⚠️  Problemas de retenção",
-            "cross_ref": "🔗 Problemas de cross-reference",
-            "categories": "📦 CATEGORIAS ESCANEADAS",
-            "error_repo": "❌ Erro: Caminho do repositório '{}' não existe.",
-            "error_save": "❌ Erro ao salvar relatório de auditoria:",
-            "error_hash": "❌ Erro ao salvar hash de auditoria:",
-            "set_env": "Defina a variável de ambiente BTAUDIT_REPO_ROOT ou execute a partir da raiz do repositório alvo.",
-            "invalid_risk": "❌ Nível de risco inválido: {}. Escolha entre: high, limited, low."
-        },
-        "en": {
-            "start": "🚀 Starting AI traceability audit (risk level: {risk_level})...",
-            "repo": "📁 Auditing repository:",
-            "scan": "🔍 Scanning repository and analyzing artifacts...",
-            "report": "📊 Generating multilingual report with legal basis...",
-            "save": "💾 Report saved at:",
-            "hash": "🔒 Integrity hash:",
-            "done": "🎯 Audit completed successfully!",
-            "summary_title": "📋 TRACEABILITY AUDIT SUMMARY",
-            "compliance": "✅ Compliance for {risk_level} risk level (legal basis: EU AI Act, NIST, ISO)",
-            "score": "📊 Score",
-            "files": "📁 Scanned files",
-            "retention": "⚠️  Retention issues",
-            "cross_ref": "🔗 Cross-reference issues",
-            "categories": "📦 SCANNED CATEGORIES",
-            "error_repo": "❌ Error: Repository path '{}' does not exist.",
-            "error_save": "❌ Error saving audit report:",
-            "error_hash": "❌ Error saving audit hash:",
-            "set_env": "Set the BTAUDIT_REPO_ROOT environment variable or run from the target repository's root.",
-            "invalid_risk": "❌ Invalid risk level: {}. Choose from: high, limited, low."
-        },
-        "es": {
-            "start": "🚀 Iniciando auditoría de trazabilidad de IA (nivel de riesgo: {risk_level})...",
-            "repo": "📁 Auditando repositorio:",
-            "scan": "🔍 Escaneando repositorio y analizando artefactos...",
-            "report": "📊 Generando informe multilingüe con base legal...",
-            "save": "💾 Informe guardado en:",
-            "hash": "🔒 Hash de integridad:",
-            "done": "🎯 ¡Auditoría completada con éxito!",
-            "summary_title": "📋 RESUMEN DE AUDITORÍA DE TRAZABILIDAD",
-            "compliance": "✅ Conformidad para nivel de riesgo {risk_level} (base legal: EU AI Act, NIST, ISO)",
-            "score": "📊 Puntuación",
-            "files": "📁 Archivos escaneados",
-            "retention": "⚠️  Problemas de retención",
-            "cross_ref": "🔗 Problemas de referencias cruzadas",
-            "categories": "📦 CATEGORÍAS ESCANEADAS",
-            "error_repo": "❌ Error: La ruta del repositorio '{}' no existe.",
-            "error_save": "❌ Error al guardar el informe de auditoría:",
-            "error_hash": "❌ Error al guardar el hash de auditoría:",
-            "set_env": "Establezca la variable de entorno BTAUDIT_REPO_ROOT o ejecute desde la raíz del repositorio objetivo.",
-            "invalid_risk": "❌ Nivel de riesgo inválido: {}. Elija entre: high, limited, low."
-        }
+# Console strings built once at import: main() asks for them more than once
+# per run and there is no reason to reconstruct the full trilingual table on
+# every call.
+_CONSOLE_MESSAGES: Dict[str, Dict[str, str]] = {
+    "pt": {
+        "start": "🚀 Iniciando auditoria de rastreabilidade de IA (nível de risco: {risk_level})...",
+        "repo": "📁 Auditando repositório:",
+        "scan": "🔍 Escaneando repositório e analisando artefatos...",
+        "report": "📊 Gerando relatório multilíngue com base legal...",
+        "save": "💾 Relatório salvo em:",
+        "hash": "🔒 Hash de integridade:",
+        "done": "🎯 Auditoria concluída com sucesso!",
+        "summary_title": "📋 RESUMO DA AUDITORIA DE RASTREABILIDADE",
+        "compliance": "✅ Conformidade com nível {risk_level} (base legal: EU AI Act, NIST, ISO)",
+        "score": "📊 Pontuação",
+        "files": "📁 Arquivos escaneados",
+        "retention": "⚠️  Problemas de retenção",
+        "cross_ref": "🔗 Problemas de cross-reference",
+        "categories": "📦 CATEGORIAS ESCANEADAS",
+        "error_repo": "❌ Erro: Caminho do repositório '{}' não existe.",
+        "error_save": "❌ Erro ao salvar relatório de auditoria:",
+        "error_hash": "❌ Erro ao salvar hash de auditoria:",
+        "set_env": "Defina a variável de ambiente BTAUDIT_REPO_ROOT ou execute a partir da raiz do repositório alvo.",
+        "invalid_risk": "❌ Nível de risco inválido: {}. Escolha entre: high, limited, low."
+    },
+    "en": {
+        "start": "🚀 Starting AI traceability audit (risk level: {risk_level})...",
+        "repo": "📁 Auditing repository:",
+        "scan": "🔍 Scanning repository and analyzing artifacts...",
+        "report": "📊 Generating multilingual report with legal basis...",
+        "save": "💾 Report saved at:",
+        "hash": "🔒 Integrity hash:",
+        "done": "🎯 Audit completed successfully!",
+        "summary_title": "📋 TRACEABILITY AUDIT SUMMARY",
+        "compliance": "✅ Compliance for {risk_level} risk level (legal basis: EU AI Act, NIST, ISO)",
+        "score": "📊 Score",
+        "files": "📁 Scanned files",
+        "retention": "⚠️  Retention issues",
+        "cross_ref": "🔗 Cross-reference issues",
+        "categories": "📦 SCANNED CATEGORIES",
+        "error_repo": "❌ Error: Repository path '{}' does not exist.",
+        "error_save": "❌ Error saving audit report:",
+        "error_hash": "❌ Error saving audit hash:",
+        "set_env": "Set the BTAUDIT_REPO_ROOT environment variable or run from the target repository's root.",
+        "invalid_risk": "❌ Invalid risk level: {}. Choose from: high, limited, low."
+    },
+    "es": {
+        "start": "🚀 Iniciando auditoría de trazabilidad de IA (nivel de riesgo: {risk_level})...",
+        "repo": "📁 Auditando repositorio:",
+        "scan": "🔍 Escaneando repositorio y analizando artefactos...",
+        "report": "📊 Generando informe multilingüe con base legal...",
+        "save": "💾 Informe guardado en:",
+        "hash": "🔒 Hash de integridad:",
+        "done": "🎯 ¡Auditoría completada con éxito!",
+        "summary_title": "📋 RESUMEN DE AUDITORÍA DE TRAZABILIDAD",
+        "compliance": "✅ Conformidad para nivel de riesgo {risk_level} (base legal: EU AI Act, NIST, ISO)",
+        "score": "📊 Puntuación",
+        "files": "📁 Archivos escaneados",
+        "retention": "⚠️  Problemas de retención",
+        "cross_ref": "🔗 Problemas de referencias cruzadas",
+        "categories": "📦 CATEGORÍAS ESCANEADAS",
+        "error_repo": "❌ Error: La ruta del repositorio '{}' no existe.",
+        "error_save": "❌ Error al guardar el informe de auditoría:",
+        "error_hash": "❌ Error al guardar el hash de auditoría:",
+        "set_env": "Establezca la variable de entorno BTAUDIT_REPO_ROOT o ejecute desde la raíz del repositorio objetivo.",
+        "invalid_risk": "❌ Nivel de riesgo inválido: {}. Elija entre: high, limited, low."
     }
-    return messages.get(lang, messages["pt"])
+}
+
+def get_console_messages(lang: str = "pt") -> Dict[str, str]:
+    return _CONSOLE_MESSAGES.get(lang, _CONSOLE_MESSAGES["pt"])
 
 def main():
     parser = argparse.ArgumentParser(description="AI/ML Risk-Aware & Regulatory-Citable Traceability Audit Runner")
@@ -1005,22 +1483,35 @@ def main():
         }
 
     # Salva o JSON com o nome obrigatório: "rastreabilidade_json"
+    # Serializa uma única vez: o mesmo buffer de bytes vai para o disco e
+    # para o SHA-256, em vez de renderizar o relatório inteiro duas vezes.
     out_json_path = PRINCIPLE_DIR / "rastreabilidade_json"
+    report_bytes = None
     try:
-        with out_json_path.open("w", encoding="utf-8") as f:
-            json.dump(final_report, f, ensure_ascii=False, indent=2)
-        logger.info(f"✅ Relatório salvo em: {out_json_path}")
+        report_bytes = _dumps_report(final_report)
     except Exception as e:
         logger.error(f"{msgs['error_save']} {e}")
         out_json_path = None
-
-    # Gera hash do conteúdo do relatório
-    try:
-        report_content = json.dumps(final_report, ensure_ascii=False, indent=2)
-        report_hash = hashlib.sha256(report_content.encode("utf-8")).hexdigest()
-    except Exception as e:
         report_hash = f"hash_generation_failed: {e}"
 
+    if report_bytes is not None:
+        report_hash = hashlib.sha256(report_bytes).hexdigest()
+        # Escreve num arquivo temporário e troca com os.replace: o rename é
+        # atômico no mesmo filesystem, então nunca existe uma janela em que
+        # um JSON parcial esteja visível no caminho final.
+        tmp_path = out_json_path.with_name(out_json_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(report_bytes)
+            os.replace(tmp_path, out_json_path)
+            logger.info(f"✅ Relatório salvo em: {out_json_path}")
+        except Exception as e:
+            logger.error(f"{msgs['error_save']} {e}")
+            out_json_path = None
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     # Salva hash na raiz da pasta do princípio
     hash_path = PRINCIPLE_DIR / "audit_hash.txt"
     try: